@@ -5,4 +5,4 @@ try:
 except DistributionNotFound:
     __version__ = '0.0.0'
 
-from graphistry.pygraphistry import register, bind, edges, nodes, graph, settings
+from graphistry.pygraphistry import register, bind, edges, nodes, graph, settings, plot_batch, register_adapter
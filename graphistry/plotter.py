@@ -6,8 +6,16 @@ from builtins import object
 import random
 import string
 import copy
+import collections
+import itertools
+import inspect
+import operator
 import types
+import hashlib
+import threading
+import numpy
 import pandas
+import requests
 
 from . import pygraphistry
 from . import util
@@ -27,6 +35,23 @@ class Plotter(object):
 
 
     _defaultNodeId = '__nodeid__'
+    _defaultEdgeKey = '__edgekey__'
+    _defaultEdgeWeight = 'weight'
+    # Bindings an upload depends on, for keying the upload cache
+    _uploadBindings = ['source', 'destination', 'node', 'edge_title', 'edge_label', 'edge_color',
+                       'edge_weight', 'point_title', 'point_label', 'point_color', 'point_size']
+    # Marks, in DataFrame.attrs, edge frames whose endpoints are categoricals over all node labels
+    _codedEndpoints = '_graphistry_coded_endpoints'
+
+    # Input adapters by type: functions of a plotter, a graph and its nodes (or None), returning
+    # edge and node dataframes. Those of optional libraries are loaded, by top-level package
+    # name, when a type from the package is first looked up, so no library is ever imported
+    # just to check an input against it. Lookups are cached per type, and loads and cache
+    # updates hold _adapterLock, so concurrent plots never see a half-loaded package.
+    _adapters = {}
+    _adapterLoaders = {}
+    _adapterCache = {}
+    _adapterLock = threading.RLock()
 
     def __init__(self):
         # Bindings
@@ -170,7 +195,7 @@ class Plotter(object):
         Must include any nodes referenced in the edge list.
 
         :param nodes: Nodes and their attributes.
-        :type point_size: Pandas dataframe
+        :type point_size: Pandas dataframe, Arrow table or Polars dataframe.
 
         :returns: Plotter.
         :rtype: Plotter.
@@ -201,7 +226,7 @@ class Plotter(object):
         """Specify edge list data and associated edge attribute values.
 
         :param edges: Edges and their attributes.
-        :type point_size: Pandas dataframe, NetworkX graph, or IGraph graph.
+        :type point_size: Pandas dataframe, Arrow table, Polars dataframe, NetworkX graph, IGraph graph, or SciPy sparse adjacency matrix.
 
         :returns: Plotter.
         :rtype: Plotter.
@@ -262,10 +287,10 @@ class Plotter(object):
         When used in a notebook environment, will also show an iframe of the visualization.
 
         :param graph: Edge table or graph.
-        :type graph: Pandas dataframe, NetworkX graph, or IGraph graph.
+        :type graph: Pandas dataframe, Arrow table, Polars dataframe, NetworkX graph, IGraph graph, or SciPy sparse adjacency matrix.
 
-        :param nodes: Nodes table.
-        :type nodes: Pandas dataframe.
+        :param nodes: Nodes table, or node labels in matrix order for a sparse adjacency matrix.
+        :type nodes: Pandas dataframe, Arrow table, Polars dataframe, or list of labels.
 
         **Example: Simple**
             ::
@@ -288,6 +313,64 @@ class Plotter(object):
 
 
         """
+        viz_url = self._upload(graph, nodes)
+        PyG = pygraphistry.PyGraphistry
+
+        if util.in_ipython() is True:
+            from IPython.core.display import HTML
+            return HTML(util.make_iframe(viz_url, self._height, PyG._protocol))
+        else:
+            print('Url: http://%s' % viz_url)
+            import webbrowser
+            webbrowser.open(viz_url)
+            return self
+
+    def plot_future(self, graph=None, nodes=None):
+        """Like ``plot()``, but upload in the background and return immediately.
+
+        Encoding, compression and upload run on a thread pool shared by all plotters, so several graphs can upload concurrently.
+
+        :returns: Future resolving to an iframe when in a notebook, otherwise to the visualization URL.
+        :rtype: concurrent.futures.Future.
+
+        **Example**
+            ::
+
+                import graphistry
+                es = pandas.DataFrame({'src': [0,1,2], 'dst': [1,2,0]})
+                future = graphistry.bind(source='src', destination='dst').plot_future(es)
+                url = future.result()
+        """
+
+        return pygraphistry.PyGraphistry._executor().submit(self._plot_result, graph, nodes)
+
+    def plot_async(self, graph=None, nodes=None, loop=None):
+        """Like ``plot_future()``, but return an asyncio future that can be awaited without blocking the event loop.
+
+        :returns: Awaitable resolving to an iframe when in a notebook, otherwise to the visualization URL.
+        :rtype: asyncio.Future.
+
+        **Example**
+            ::
+
+                import graphistry
+                es = pandas.DataFrame({'src': [0,1,2], 'dst': [1,2,0]})
+                url = await graphistry.bind(source='src', destination='dst').plot_async(es)
+        """
+
+        import asyncio
+        return asyncio.wrap_future(self.plot_future(graph, nodes), loop=loop)
+
+    def _plot_result(self, graph, nodes):
+        viz_url = self._upload(graph, nodes)
+        PyG = pygraphistry.PyGraphistry
+        if util.in_ipython() is True:
+            from IPython.core.display import HTML
+            return HTML(util.make_iframe(viz_url, self._height, PyG._protocol))
+        else:
+            return PyG._absolute_url(viz_url)
+
+    def _resolve_graph(self, graph, nodes):
         if graph is None:
             if self._edges is None:
                 util.error('Graph/edges must be specified.')
@@ -296,26 +379,141 @@ class Plotter(object):
             g = graph
         n = self._nodes if nodes is None else nodes
 
-        self._check_mandatory_bindings(not isinstance(n, type(None)))
+        self._check_mandatory_bindings(False)
+        return (g, n)
+
+    def _encode(self, graph, nodes):
+        """Build and compress the dataset for an upload, without sending it, with its upload keys
+        (see ``_upload_keys``).
+
+        The result only holds picklable values, so it can be produced in another process.
+        """
+        (g, n) = self._resolve_graph(graph, nodes)
         PyG = pygraphistry.PyGraphistry
 
+        # Converters may bind missing attributes (e.g. "node"), so they run on a copy of this plotter
+        res = copy.copy(self)
+        (e, n) = res._graph_frames(g, n)
+        (key, rebind_key) = res._upload_keys(e, n)
+        encoded = {'api': PyG.api, 'key': key, 'rebind_key': rebind_key}
         if (PyG.api == 1):
-            dataset = self._plot_dispatch(g, n, 'json')
-            info = PyG._etl1(dataset)
+            dataset = res._make_dataset(e, n, 'json')
+            encoded['data'] = PyG._get_data_file(dataset, 'json').getvalue()
         elif (PyG.api == 2):
-            dataset = self._plot_dispatch(g, n, 'vgraph')
-            info = PyG._etl2(dataset['encodings'], dataset['vgraph'])
+            dataset = res._make_dataset(e, n, 'vgraph')
+            encoded.update(encodings=dataset['encodings'], vgraph_version=dataset['vgraph'].version,
+                           data=PyG._get_data_file(dataset['vgraph'], 'vgraph').getvalue())
+        elif (PyG.api == 3):
+            dataset = res._make_dataset(e, n, 'arrow')
+            encoded.update(encodings=dataset['encodings'],
+                           data=[PyG._get_data_file(dataset[t], 'arrow').getvalue()
+                                 for t in ['edges', 'nodes']])
+        return encoded
+
+    def _upload(self, graph, nodes):
+        (g, n) = self._resolve_graph(graph, nodes)
+        PyG = pygraphistry.PyGraphistry
 
-        viz_url = PyG._viz_url(info['name'], info['viztoken'], self._url_params)
+        # Converters may bind missing attributes (e.g. "node"), so they run on a copy of this plotter
+        res = copy.copy(self)
+        (e, n) = res._graph_frames(g, n)
+        (key, rebind_key) = res._upload_keys(e, n)
 
-        if util.in_ipython() is True:
-            from IPython.core.display import HTML
-            return HTML(util.make_iframe(viz_url, self._height, PyG._protocol))
-        else:
-            print('Url: http://%s' % viz_url)
-            import webbrowser
-            webbrowser.open(viz_url)
-            return self
+        def upload():
+            if (PyG.api == 1):
+                dataset = res._make_dataset(e, n, 'json')
+                return PyG._etl1(dataset, key)
+            elif (PyG.api == 2 or PyG.api == 3):
+                return res._upload_v2(e, n, rebind_key, key)
+
+        info = PyG._cached_upload(key, upload)
+        return PyG._viz_url(info['name'], info['viztoken'], res._url_params)
+
+    def _upload_v2(self, edges, nodes, rebind_key, resume_key=None):
+        PyG = pygraphistry.PyGraphistry
+
+        def encodings():
+            ncols = [self._node or Plotter._defaultNodeId] if nodes is None else nodes.columns
+            return self._encodings_v2(edges.columns, ncols)
+
+        def upload():
+            if PyG.api == 3:
+                dataset = self._make_dataset(edges, nodes, 'arrow')
+                return PyG._etl2_arrow(dataset['encodings'], dataset['edges'], dataset['nodes'])
+            else:
+                dataset = self._make_dataset(edges, nodes, 'vgraph')
+                return PyG._etl2(dataset['encodings'], dataset['vgraph'], resume_key)
+
+        return PyG._rebound_upload(rebind_key, encodings, upload)
+
+    def _upload_keys(self, edges, nodes):
+        """Key of the upload cache and of resumable uploads (None when neither is on), and key of the
+        dataset for re-binding API 2 and 3 encodings (None with API 1). The frames are hashed once."""
+        PyG = pygraphistry.PyGraphistry
+        cached = PyG.cache or PyG.chunk_size
+        frames = self._frames_digest(edges, nodes) if cached or PyG.api != 1 else None
+        key = self._content_key(frames, Plotter._uploadBindings) if cached else None
+        rebind_key = self._content_key(frames, ['source', 'destination', 'node']) if PyG.api != 1 else None
+        return (key, rebind_key)
+
+    def _content_key(self, frames, bnds):
+        """Hash of a digest of the frames, the given bindings and the server and account settings,
+        or None without a digest."""
+        if frames is None:
+            return None
+        PyG = pygraphistry.PyGraphistry
+        config = [PyG._hostname, PyG.api_key, PyG.api, PyG._vgraph_version() if PyG.api == 2 else None,
+                  PyG.downcast if PyG.api == 2 else None]
+        sha = hashlib.sha1(frames.encode('utf8'))
+        sha.update(str([getattr(self, '_' + b) for b in bnds] + config).encode('utf8'))
+        return sha.hexdigest()
+
+    def _frames_digest(self, edges, nodes):
+        """Hash of the edge and node frames, or None when they hold unhashable values.
+
+        Every API 2 upload computes it, so values are hashed from their buffers wherever they have
+        some: NumPy arrays, Arrow-backed columns (including pyarrow strings), and object columns
+        that Arrow can convert.
+        """
+        def arrowArray(col):
+            if isinstance(col.dtype, numpy.dtype) and col.dtype.kind != 'O':
+                return None
+            try:
+                import pyarrow
+                if col.dtype.kind == 'O' and isinstance(col.dtype, numpy.dtype):
+                    return pyarrow.chunked_array([pyarrow.array(col.values, from_pandas=True)])
+                if hasattr(col.array, '__arrow_array__'):
+                    array = col.array.__arrow_array__()
+                    return array if hasattr(array, 'chunks') else pyarrow.chunked_array([array])
+            except (ImportError, TypeError, ValueError):
+                # Also pyarrow.ArrowInvalid and ArrowTypeError, for mixed values
+                pass
+            return None
+
+        sha = hashlib.sha1()
+        for df in [edges, nodes]:
+            if df is None:
+                sha.update(b'None')
+                continue
+            sha.update(str([(c, df[c].dtype.name) for c in df.columns]).encode('utf8'))
+            for c in df.columns:
+                col = df[c]
+                if isinstance(col.dtype, numpy.dtype) and col.dtype.kind in 'biufcmM':
+                    sha.update(numpy.ascontiguousarray(col.values).view(numpy.uint8))
+                    continue
+                array = arrowArray(col)
+                if array is not None:
+                    # Arrow buffers are hashed in place, with the window each chunk views of them
+                    for chunk in array.chunks:
+                        sha.update(str([chunk.offset, len(chunk)]).encode('utf8'))
+                        for buf in chunk.buffers():
+                            sha.update(b'' if buf is None else buf)
+                    continue
+                try:
+                    sha.update(pandas.util.hash_pandas_object(col, index=False).values.tobytes())
+                except TypeError:
+                    return None
+        return sha.hexdigest()
 
     def pandas2igraph(self, edges, directed=True):
         """Convert a pandas edge dataframe to an IGraph graph.
@@ -347,10 +545,41 @@ class Plotter(object):
         eattribs = edges.columns.values.tolist()
         eattribs.remove(self._source)
         eattribs.remove(self._destination)
-        cols = [self._source, self._destination] + eattribs
-        etuples = [tuple(x) for x in edges[cols].values]
-        return igraph.Graph.TupleList(etuples, directed=directed, edge_attrs=eattribs,
-                                      vertex_name_attr=self._node)
+
+        # Vertices are numbered by first appearance as src0, dst0, src1, dst1, ...
+        n = len(edges)
+        ends = pandas.concat([edges[self._source], edges[self._destination]], ignore_index=True)
+        interleaved = numpy.arange(2 * n).reshape(2, n).T.ravel()
+        (codes, ids) = pandas.factorize(ends.take(interleaved))
+        ids = list(ids)
+        if (codes < 0).any():
+            codes = numpy.where(codes < 0, len(ids), codes)
+            ids.append(numpy.nan)
+
+        ig = igraph.Graph(n=len(ids), edges=codes.reshape(-1, 2), directed=directed)
+        ig.vs[self._node] = ids
+        for attrib in eattribs:
+            ig.es[attrib] = edges[attrib].tolist()
+        return ig
+
+    def arrow2pandas(self, table):
+        """Convert an Arrow table or a Polars dataframe to a pandas dataframe sharing its memory.
+
+        Columns keep their Arrow types (as ``pandas.ArrowDtype``), so no values are copied or turned
+        into Python objects. Encoders convert them one column at a time, and Arrow uploads (API 3)
+        send the buffers as they are. Requires pyarrow and pandas 1.5 or later.
+
+        :param table: Edge or node table.
+        :type table: Arrow table or record batch, or Polars dataframe.
+
+        :returns: Pandas dataframe.
+        :rtype: Pandas dataframe.
+        """
+
+        import pyarrow
+        if not isinstance(table, (pyarrow.Table, pyarrow.RecordBatch)):
+            table = table.to_arrow()
+        return table.to_pandas(types_mapper=pandas.ArrowDtype)
 
     def igraph2pandas(self, ig):
         """Under current bindings, transform an IGraph into a pandas edges dataframe and a nodes dataframe.
@@ -371,48 +600,120 @@ class Plotter(object):
                 g.nodes(vs2).bind(point_color='community').plot()
         """
 
-        def get_edgelist(ig):
-            idmap = dict(enumerate(ig.vs[self._node]))
-            for e in ig.es:
-                t = e.tuple
-                yield dict({self._source: idmap[t[0]], self._destination: idmap[t[1]]},
-                            **e.attributes())
-
         self._check_mandatory_bindings(False)
+        vattribs = ig.vs.attributes()
+        ndata = dict((a, ig.vs[a]) for a in vattribs)
         if self._node is None:
             util.warn('"node" is unbound, automatically binding it to "%s".' % Plotter._defaultNodeId)
-            ig.vs[Plotter._defaultNodeId] = [v.index for v in ig.vs]
             self._node = Plotter._defaultNodeId
-        elif self._node not in ig.vs.attributes():
+            ndata[self._node] = numpy.arange(ig.vcount())
+            vattribs = vattribs + [self._node]
+        elif self._node not in vattribs:
             util.error('Vertex attribute "%s" bound to "node" does not exist.' % self._node)
-
-        edata = get_edgelist(ig)
-        ndata = [v.attributes() for v in ig.vs]
-        nodes = pandas.DataFrame(ndata, columns=ig.vs.attributes())
-        cols = [self._source, self._destination] + ig.es.attributes()
-        edges = pandas.DataFrame(edata, columns=cols)
+        nodes = pandas.DataFrame(ndata, columns=vattribs)
+
+        # Vertex indices of the edge list are mapped to node ids with a single take
+        ends = numpy.array(ig.get_edgelist(), dtype=numpy.int64).reshape(-1, 2)
+        ids = nodes[self._node].values
+        eattribs = ig.es.attributes()
+        edata = dict((a, ig.es[a]) for a in eattribs)
+        edata[self._source] = ids.take(ends[:, 0])
+        edata[self._destination] = ids.take(ends[:, 1])
+        edges = pandas.DataFrame(edata, columns=[self._source, self._destination] + eattribs)
         return (edges, nodes)
 
     def networkx2pandas(self, g):
-        def get_nodelist(g):
-            for n in g.nodes(data=True):
-                yield dict({self._node: n[0]}, **n[1])
-        def get_edgelist(g):
-            for e in g.edges(data=True):
-                yield dict({self._source: e[0], self._destination: e[1]}, **e[2])
+        def transpose(rows, width):
+            # One list per tuple position, in a single pass. Unlike zip(*rows), no row outlives
+            # its iteration, which would trigger repeated garbage collections of all of them.
+            columns = [[] for _ in range(width)]
+            appends = [c.append for c in columns]
+            for row in rows:
+                for (append, value) in zip(appends, row):
+                    append(value)
+            return columns
+
+        def frame(names, columns):
+            # Bound columns, then one column per attribute of the trailing attribute dicts, in
+            # order of first appearance. Missing attribute values are NaN.
+            dicts = columns[-1]
+            attribs = list(collections.OrderedDict.fromkeys(itertools.chain.from_iterable(dicts)))
+            if all(len(d) == len(attribs) for d in dicts):
+                data = dict((a, list(map(operator.itemgetter(a), dicts))) for a in attribs)
+            else:
+                data = dict((a, [d.get(a, numpy.nan) for d in dicts]) for a in attribs)
+            data.update(zip(names, columns))
+            names = names + [a for a in attribs if a not in names]
+            return (pandas.DataFrame(data, columns=names), attribs)
 
         self._check_mandatory_bindings(False)
-        vattribs = g.nodes(data=True)[0][1] if g.number_of_nodes() > 0 else []
         if self._node is None:
             util.warn('"node" is unbound, automatically binding it to "%s".' % Plotter._defaultNodeId)
-        elif self._node in vattribs:
+        node = self._node or Plotter._defaultNodeId
+
+        (nodes, vattribs) = frame([node], transpose(g.nodes(data=True), 2))
+        if self._node is not None and self._node in vattribs:
             util.error('Vertex attribute "%s" already exists.' % self._node)
+        self._node = node
 
-        self._node = self._node or Plotter._defaultNodeId
-        nodes = pandas.DataFrame(get_nodelist(g))
-        edges = pandas.DataFrame(get_edgelist(g))
+        # Multigraph edge keys are kept, to tell parallel edges apart
+        if g.is_multigraph():
+            names = [self._source, self._destination, Plotter._defaultEdgeKey]
+            rows = g.edges(keys=True, data=True)
+        else:
+            names = [self._source, self._destination]
+            rows = g.edges(data=True)
+        (edges, _) = frame(names, transpose(rows, len(names) + 1))
         return (edges, nodes)
 
+    def scipy2pandas(self, matrix, nodes=None):
+        """Convert a SciPy sparse adjacency matrix to edge and node dataframes.
+
+        Each stored entry (i, j) is an edge from node i to node j, with the entry's value in the
+        column bound to "edge_weight". Sources and destinations are categoricals over the node
+        labels, so vgraph uploads (API 2) send the matrix indices as they are.
+
+        :param matrix: Square adjacency matrix.
+        :type matrix: SciPy sparse matrix or array.
+
+        :param nodes: Node labels, or a node table, in matrix order. Defaults to 0 .. n-1.
+        :type nodes: List, NumPy array, Pandas series or Pandas dataframe.
+
+        :returns: Edge and node dataframes.
+        :rtype: Pair of Pandas dataframes.
+        """
+
+        self._check_mandatory_bindings(False)
+        if matrix.shape[0] != matrix.shape[1]:
+            util.error('Adjacency matrix must be square, not %dx%d.' % matrix.shape)
+        if self._node is None:
+            util.warn('"node" is unbound, automatically binding it to "%s".' % Plotter._defaultNodeId)
+        self._node = self._node or Plotter._defaultNodeId
+        if self._edge_weight is None:
+            util.warn('"edge_weight" is unbound, automatically binding it to "%s".' % Plotter._defaultEdgeWeight)
+        self._edge_weight = self._edge_weight or Plotter._defaultEdgeWeight
+
+        csr = matrix.tocsr()
+        size = csr.shape[0]
+        if nodes is None:
+            nodes = pandas.DataFrame({self._node: numpy.arange(size)})
+        elif not isinstance(nodes, pandas.core.frame.DataFrame):
+            nodes = pandas.DataFrame({self._node: numpy.asarray(nodes)})
+        self._check_bound_attribs(nodes, ['node'], 'Vertex')
+        if len(nodes) != size:
+            util.error('Expected %d nodes, one per matrix row, got %d.' % (size, len(nodes)))
+
+        labels = pandas.Index(nodes[self._node])
+        rows = numpy.repeat(numpy.arange(size, dtype=csr.indices.dtype), numpy.diff(csr.indptr))
+        edges = pandas.DataFrame(collections.OrderedDict([
+            (self._source, pandas.Categorical.from_codes(rows, labels)),
+            (self._destination, pandas.Categorical.from_codes(csr.indices, labels)),
+            (self._edge_weight, csr.data)
+        ]))
+        if hasattr(edges, 'attrs'):
+            edges.attrs[Plotter._codedEndpoints] = True
+        return (edges, nodes.reset_index(drop=True))
+
     def _check_mandatory_bindings(self, node_required):
         if self._source is None or self._destination is None:
             util.error('Both "source" and "destination" must be bound before plotting.')
@@ -426,30 +727,43 @@ class Plotter(object):
             if b not in cols:
                 util.error('%s attribute "%s" bound to "%s" does not exist.' % (typ, a, b))
 
-    def _plot_dispatch(self, graph, nodes, mode='json'):
-        if isinstance(graph, pandas.core.frame.DataFrame):
-            return self._make_dataset(graph, nodes, mode)
-
-        try:
-            import igraph
-            if isinstance(graph, igraph.Graph):
-                (e, n) = self.igraph2pandas(graph)
-                return self._make_dataset(e, n, mode)
-        except ImportError:
-            pass
-
+    def _graph_frames(self, graph, nodes):
+        adapter = Plotter._adapter(type(graph))
+        if adapter is None:
+            util.error('Expected Pandas dataframe(s), Arrow table(s), Polars dataframe(s), Igraph/NetworkX graph, '
+                       'SciPy sparse matrix, or a graph type with a registered adapter.')
+        (e, n) = adapter(self, graph, nodes)
+        # Checked on the adapter's frames, as adapters may bind "node" themselves
+        self._check_mandatory_bindings(not isinstance(n, type(None)))
+        return (e, n)
+
+    def _table_frame(self, table):
+        """Pandas dataframe for a node table with an adapter (e.g. an Arrow table), or the value itself."""
+        if table is None or isinstance(table, pandas.core.frame.DataFrame):
+            return table
+        adapter = Plotter._adapter(type(table))
+        return table if adapter is None else adapter(self, table, None)[0]
+
+    @staticmethod
+    def _adapter(cls):
+        """Adapter of the nearest class in the MRO of cls that has one, or None."""
         try:
-            import networkx
-            if isinstance(graph, networkx.classes.graph.Graph) or \
-               isinstance(graph, networkx.classes.digraph.DiGraph) or \
-               isinstance(graph, networkx.classes.multigraph.MultiGraph) or \
-               isinstance(graph, networkx.classes.multidigraph.MultiDiGraph):
-                (e, n) = self.networkx2pandas(graph)
-                return self._make_dataset(e, n, mode)
-        except ImportError:
+            return Plotter._adapterCache[cls]
+        except KeyError:
             pass
-
-        util.error('Expected Pandas dataframe(s) or Igraph/NetworkX graph.')
+        with Plotter._adapterLock:
+            if cls not in Plotter._adapterCache:
+                mro = inspect.getmro(cls)
+                for klass in mro:
+                    package = klass.__module__.split('.')[0]
+                    load = Plotter._adapterLoaders.get(package)
+                    if load is not None:
+                        # Adapters registered by users take precedence
+                        for (key, adapter) in load().items():
+                            Plotter._adapters.setdefault(key, adapter)
+                        del Plotter._adapterLoaders[package]
+                Plotter._adapterCache[cls] = next((Plotter._adapters[k] for k in mro if k in Plotter._adapters), None)
+            return Plotter._adapterCache[cls]
 
     def _sanitize_dataset(self, edges, nodes, nodeid):
         self._check_bound_attribs(edges, ['source', 'destination'], 'Edge')
@@ -501,10 +815,16 @@ class Plotter(object):
         return (elist, nlist)
 
     def _bind_attributes_v2(self, edges, nodes):
-        def bind(enc, df, pbname, attrib, default=None):
+        nodeid = self._node or Plotter._defaultNodeId
+        (elist, nlist) = self._sanitize_dataset(edges, nodes, nodeid)
+        self._check_dataset_size(elist, nlist)
+        return (elist, nlist, self._encodings_v2(elist.columns, nlist.columns))
+
+    def _encodings_v2(self, ecols, ncols):
+        def bind(enc, cols, pbname, attrib, default=None):
             bound = getattr(self, attrib)
             if bound:
-                if bound in df.columns.tolist():
+                if bound in cols:
                     enc[pbname] = bound
                 else:
                     util.warn('Attribute "%s" bound to %s does not exist.' % (bound, attrib))
@@ -512,116 +832,336 @@ class Plotter(object):
                 enc[pbname] = default
 
         nodeid = self._node or Plotter._defaultNodeId
-        (elist, nlist) = self._sanitize_dataset(edges, nodes, nodeid)
-        self._check_dataset_size(elist, nlist)
+        ecols = list(ecols)
+        ncols = list(ncols)
 
         encodings = {
             'source': self._source,
             'destination': self._destination,
             'nodeId': self._node
         }
-        bind(encodings, elist, 'edgeColor', '_edge_color')
-        bind(encodings, elist, 'edgeLabel', '_edge_label')
-        bind(encodings, elist, 'edgeTitle', '_edge_title')
-        bind(encodings, elist, 'edgeWeight', '_edge_weight')
-        bind(encodings, nlist, 'pointColor', '_point_color')
-        bind(encodings, nlist, 'pointLabel', '_point_label')
-        bind(encodings, nlist, 'pointTitle', '_point_title', nodeid)
-        bind(encodings, nlist, 'pointSize', '_point_size')
-        return (elist, nlist, encodings)
+        bind(encodings, ecols, 'edgeColor', '_edge_color')
+        bind(encodings, ecols, 'edgeLabel', '_edge_label')
+        bind(encodings, ecols, 'edgeTitle', '_edge_title')
+        bind(encodings, ecols, 'edgeWeight', '_edge_weight')
+        bind(encodings, ncols, 'pointColor', '_point_color')
+        bind(encodings, ncols, 'pointLabel', '_point_label')
+        bind(encodings, ncols, 'pointTitle', '_point_title', nodeid)
+        bind(encodings, ncols, 'pointSize', '_point_size')
+        return encodings
 
     def _make_dataset(self, edges, nodes, mode):
         if mode == 'json':
             return self._make_json_dataset(edges, nodes)
         elif mode == 'vgraph':
             return self._make_vgraph_dataset(edges, nodes)
+        elif mode == 'arrow':
+            return self._make_arrow_dataset(edges, nodes)
         else:
             raise ValueError('Unknown mode: ' + mode)
 
     def _make_json_dataset(self, edges, nodes):
         (elist, nlist) = self._bind_attributes_v1(edges, nodes)
 
-        edict = elist.where((pandas.notnull(elist)), None).to_dict(orient='records')
         name = ''.join(random.choice(string.ascii_uppercase +
                                      string.digits) for _ in range(10))
         bindings = {'idField': self._node or Plotter._defaultNodeId,
                     'destinationField': self._destination, 'sourceField': self._source}
         dataset = {'name': pygraphistry.PyGraphistry._dataset_prefix + name,
-                   'bindings': bindings, 'type': 'edgelist', 'graph': edict}
+                   'bindings': bindings, 'type': 'edgelist', 'graph': elist}
+        if pygraphistry.PyGraphistry.json_layout == 'columns':
+            dataset['type'] = 'edgelist_columns'
         if nlist is not None:
-            ndict = nlist.where((pandas.notnull(nlist)), None).to_dict(orient='records')
-            dataset['labels'] = ndict
+            dataset['labels'] = nlist
         return dataset
 
+    def _make_arrow_dataset(self, edges, nodes):
+        import pyarrow
+
+        def arrowColumn(col):
+            try:
+                return pyarrow.Array.from_pandas(col)
+            except (pyarrow.ArrowInvalid, pyarrow.ArrowTypeError):
+                # Mixed object columns are sent as strings, as in vgraphs
+                return pyarrow.Array.from_pandas(col.where(col.isnull(), col.astype(str)))
+
+        def arrowTable(df):
+            return pyarrow.Table.from_arrays([arrowColumn(df[c]) for c in df.columns],
+                                             names=[str(c) for c in df.columns])
+
+        (elist, nlist, encodings) = self._bind_attributes_v2(edges, nodes)
+        return {'encodings': encodings, 'edges': arrowTable(elist), 'nodes': arrowTable(nlist)}
+
     def _make_vgraph_dataset(self, edges, nodes):
-        from graph_vector_pb2 import VectorGraph
+        from .graph_vector_pb2 import VectorGraph
+
+        def storeEdges(vg, srcs, dsts):
+            # Wire format of the repeated Edge field, written for all edges at once:
+            # tag(6, LEN) len tag(1, VARINT) src tag(2, VARINT) dst
+            slens = util.varint_lengths(srcs)
+            dlens = util.varint_lengths(dsts)
+            msglens = 2 + slens + dlens
+            ends = numpy.cumsum(msglens + 2)
+            starts = ends - (msglens + 2)
+            buf = numpy.zeros(ends[-1] if len(ends) else 0, dtype=numpy.uint8)
+            buf[starts] = 0x32
+            buf[starts + 1] = msglens
+            buf[starts + 2] = 0x08
+            util.write_varints(buf, starts + 3, srcs, slens)
+            buf[starts + 3 + slens] = 0x10
+            util.write_varints(buf, starts + 4 + slens, dsts, dlens)
+            vg.MergeFromString(buf.tobytes())
+
+        def storeEdgeArrays(vg, srcs, dsts):
+            # Schema version 1+: packed sources (field 10) and destinations (field 11)
+            vg.MergeFromString(util.encode_packed(10, util.encode_varints(srcs)) +
+                               util.encode_packed(11, util.encode_varints(dsts)))
+
+        def stringValues(col):
+            values = numpy.array(col, dtype=object)
+            values[pandas.isnull(values)] = ''
+            kind = pandas.api.types.infer_dtype(values)
+            if kind == 'bytes':
+                values = pandas.Series(values).str.decode('utf8').values
+            elif kind != 'string':
+                values = values.astype(str)
+            return values.tolist()
+
+        def epochMillis(col):
+            # Datetimes (in UTC) and durations as milliseconds: int64 when none are missing and
+            # the schema has int64 vectors, otherwise doubles with missing ones as NaN
+            unit = 'datetime64[us]' if col.dtype.kind == 'M' else 'timedelta64[us]'
+            values = col.to_numpy(dtype=unit)
+            missing = numpy.isnat(values)
+            if vg.version >= 3 and not missing.any():
+                return values.view(numpy.int64) // 1000
+            millis = values.view(numpy.int64) / 1000.0
+            millis[missing] = numpy.nan
+            return millis
+
+        def storeDictionary(name, target, codes, uniques):
+            # Schema version 2+: dictionary of distinct strings (field 3) and packed codes (field 4)
+            vec = vg.dictionary_vectors.add()
+            vec.name = name
+            vec.target = target
+            vec.dictionary.extend(stringValues(uniques))
+            if (codes < 0).any():
+                # Missing values are empty strings, as in plain string vectors
+                codes = numpy.where(codes < 0, len(uniques), codes)
+                vec.dictionary.append('')
+            codes = numpy.asarray(codes).astype(numpy.uint32)
+            vec.MergeFromString(util.encode_packed(4, util.encode_varints(codes)))
+
+        def storeStrings(col, name, target):
+            # Columns repeating few distinct strings are sent as dictionaries
+            if vg.version >= 2:
+                (codes, uniques) = pandas.factorize(numpy.asarray(col, dtype=object))
+                if 2 * len(uniques) < len(codes):
+                    storeDictionary(name, target, codes, uniques)
+                    return
+            vec = vg.string_vectors.add()
+            vec.name = name
+            vec.target = target
+            vec.values.extend(stringValues(col))
+
+        def storeCategorical(col, name, target):
+            categories = col.cat.categories
+            if categories.dtype.kind in 'biufMm':
+                # Numeric categories are sent as the values they stand for
+                dtype = categories.dtype
+                if dtype.kind in 'biu' and col.hasnans:
+                    dtype = numpy.float64
+                storeColumn(col.astype(dtype), name, target)
+            elif vg.version >= 2:
+                storeDictionary(name, target, col.cat.codes.values, categories)
+            else:
+                # Code -1 (missing) picks the trailing empty string
+                values = numpy.array(stringValues(categories) + [''], dtype=object)
+                vec = vg.string_vectors.add()
+                vec.name = name
+                vec.target = target
+                vec.values.extend(values[col.cat.codes.values].tolist())
+
+        def storeColumn(col, name, target):
+            # Numeric vectors are merged in as pre-encoded packed 'values' (field 3)
+            if isinstance(col.dtype, pandas.api.types.CategoricalDtype):
+                storeCategorical(col, name, target)
+                return
+            values = epochMillis(col) if col.dtype.kind in 'Mm' else numpy.asarray(col)
+            kind = values.dtype.kind
+            negative = kind == 'i' and len(values) > 0 and values.min() < 0
+            if kind in 'iu' and vg.version < 3 and \
+               (negative or (values.dtype.itemsize > 4 and len(values) > 0 and values.max() > 0xFFFFFFFF)):
+                raise ValueError('Column "%s" has integers outside the unsigned 32-bit range of int32 vectors, '
+                                 'which requires vgraph_version=3.' % name)
+            if kind == 'u' and values.dtype.itemsize > 4 and len(values) > 0 and \
+               values.max() > numpy.iinfo(numpy.int64).max:
+                # Beyond the int64 range, values are only sent exactly as strings
+                storeStrings(col, name, target)
+                return
+            if kind in 'iu' and vg.version >= 3 and \
+               (negative or (values.dtype.itemsize >= 4 and values.dtype != numpy.int32)):
+                # Schema version 3+: integers that may be negative or not fit 32 bits go to int64
+                # vectors, as int32 vectors hold unsigned values
+                vec = vg.int64_vectors.add()
+                ints = values.astype(numpy.int64).view(numpy.uint64)
+                vec.MergeFromString(util.encode_packed(3, util.encode_varints(ints)))
+            elif kind in 'biu':
+                vec = vg.int32_vectors.add()
+                ints = values.astype(numpy.int32).view(numpy.uint32)
+                vec.MergeFromString(util.encode_packed(3, util.encode_varints(ints)))
+            elif kind == 'f' and vg.version >= 3 and values.dtype.itemsize == 4:
+                # Schema version 3+: float32 columns keep their width, in float vectors (field 2)
+                vec = vg.float_vectors.add()
+                vec.MergeFromString(util.encode_packed(2, values.astype('<f4').tobytes()))
+            elif kind == 'f':
+                vec = vg.double_vectors.add()
+                vec.MergeFromString(util.encode_packed(3, values.astype('<f8').tobytes()))
+            else:
+                storeStrings(col, name, target)
+                return
+            vec.name = name
+            vec.target = target
+
+        def storeAttributes(df, target, skip):
+            for col in df.columns:
+                if col in skip:
+                    continue
+                storeColumn(util.numpy_column(df[col], numeric_bools=True), col, target)
+
+        def downcast(df, target, skip):
+            # Schema version 3+: float64 columns representable as float32 (within the tolerance,
+            # if any) go to float vectors. Integers are left alone: varints already shrink small
+            # values, and int32 vectors are unsigned, so narrowing could not keep negative ones
+            tolerance = pygraphistry.PyGraphistry.downcast
+            narrowed = df.copy(deep=False)
+            columns = []
+            for col in df.columns:
+                if col in skip:
+                    continue
+                series = util.numpy_column(df[col])
+                values = numpy.asarray(series)
+                if len(values) == 0 or not isinstance(series.dtype, numpy.dtype) or \
+                   values.dtype != numpy.float64:
+                    continue
+                with numpy.errstate(over='ignore', invalid='ignore'):
+                    narrow = values.astype(numpy.float32)
+                    error = numpy.abs(narrow.astype(numpy.float64) - values)
+                    exact = (error == 0) | numpy.isnan(values)
+                    if tolerance is True:
+                        ok = exact.all()
+                    else:
+                        ok = (exact | (error <= tolerance * numpy.abs(values))).all()
+                if not ok:
+                    continue
+                narrowed[col] = narrow
+                columns.append({'column': col, 'target': target, 'from': values.dtype.name,
+                                'to': narrow.dtype.name, 'bytes_saved': 4 * len(values)})
+            return (narrowed, columns)
 
         def storeEdgeAttributes(df):
-            coltypes = df.columns.to_series().groupby(df.dtypes)
-            for dtype, cols in coltypes.groups.items():
-                for col in cols:
-                    if col == self._source or col == self._destination:
-                        continue
-                    if dtype.name == 'object':
-                        df[col].where(pandas.notnull(df[col]), '', inplace=True)
-                        df[col] = df[col].map(lambda x: x.decode('utf8'))
-                    vec = typemap[dtype.name].add()
-                    vec.name = col
-                    vec.type = VectorGraph.EDGE
-                    for val in df[col]:
-                        vec.values.append(val)
-
-        def storeNodeAttributes(df, nodeid, node_map):
-            ordercol = '__order__'
-            df[ordercol] = df[nodeid].map(lambda n: node_map[n])
-            sdf = df.sort(ordercol)
-            coltypes = df.columns.to_series().groupby(df.dtypes)
-            for dtype, cols in coltypes.groups.items():
-                for col in cols:
-                    if col == nodeid or col == ordercol:
-                        continue
-                    if dtype.name == 'object':
-                        df[col].where(pandas.notnull(df[col]), '', inplace=True)
-                        df[col] = df[col].map(lambda x: x.decode('utf8'))
-                    vec = typemap[dtype.name].add()
-                    vec.name = col
-                    vec.type = VectorGraph.VERTEX
-                    for val in df[col]:
-                        vec.values.append(val)
+            storeAttributes(df, VectorGraph.EDGE, [self._source, self._destination])
+
+        def storeNodeAttributes(df, nodeid):
+            storeAttributes(df, VectorGraph.VERTEX, [nodeid])
 
         (elist, nlist, enc) = self._bind_attributes_v2(edges, nodes)
         nodeid = self._node or Plotter._defaultNodeId
 
         vg = VectorGraph()
-        typemap = {
-            'object': vg.string_vectors,
-            'int32': vg.int32_vectors,
-            'int64': vg.int32_vectors,
-            'float32': vg.double_vectors,
-            'float64': vg.double_vectors
-        }
 
         sources = elist[self._source]
         dests = elist[self._destination]
 
-        lnodes = pandas.concat([sources, dests], ignore_index=True).unique()
+        if getattr(edges, 'attrs', {}).get(Plotter._codedEndpoints) and \
+           isinstance(sources.dtype, pandas.api.types.CategoricalDtype) and \
+           isinstance(dests.dtype, pandas.api.types.CategoricalDtype) and \
+           sources.cat.categories.equals(dests.cat.categories):
+            # Endpoints from scipy2pandas keep their codes, and every node label is a vertex. Other
+            # categoricals may have unused categories, so they are factorized like any column
+            lnodes = sources.cat.categories
+            srcs = sources.cat.codes.values.astype(numpy.uint32)
+            dsts = dests.cat.codes.values.astype(numpy.uint32)
+        else:
+            # Sources and destinations share one code space, numbered by first appearance
+            (codes, lnodes) = pandas.factorize(pandas.concat([sources, dests], ignore_index=True))
+            codes = codes.astype(numpy.uint32)
+            srcs = codes[:len(sources)]
+            dsts = codes[len(sources):]
+
+        # Left merge keeps lnodes order, so node attributes line up with the codes above
         lnodes_df = pandas.DataFrame(lnodes, columns=[nodeid])
-        filtered_nlist = pandas.merge(lnodes_df, nlist, on=nodeid, how='left')
-        node_map = dict([(v, i) for i, v in enumerate(lnodes.tolist())])
+        filtered_nlist = pandas.merge(lnodes_df, nlist.drop_duplicates(subset=[nodeid]),
+                                      on=nodeid, how='left')
 
-        vg.version = 0
+        vg.version = pygraphistry.PyGraphistry._vgraph_version()
         vg.type = VectorGraph.DIRECTED
-        vg.nvertices = len(node_map)
+        vg.nvertices = len(lnodes)
         vg.nedges = len(elist)
         name = ''.join(random.choice(string.ascii_uppercase + string.digits) for _ in range(10))
         vg.name = pygraphistry.PyGraphistry._dataset_prefix + name
 
-        for s, d in zip(sources.tolist(), dests.tolist()):
-            e = vg.edges.add()
-            e.src = node_map[s]
-            e.dst = node_map[d]
-
+        if vg.version >= 1:
+            storeEdgeArrays(vg, srcs, dsts)
+        else:
+            storeEdges(vg, srcs, dsts)
+        pygraphistry.PyGraphistry.downcast_report = None
+        if pygraphistry.PyGraphistry.downcast is not False and vg.version < 3:
+            util.warn('Downcasting requires VectorGraph schema version 3, sending columns at full width.')
+        elif pygraphistry.PyGraphistry.downcast is not False:
+            (elist, ecols) = downcast(elist, 'edge', [self._source, self._destination])
+            (filtered_nlist, ncols) = downcast(filtered_nlist, 'node', [nodeid])
+            pygraphistry.PyGraphistry.downcast_report = {
+                'columns': ecols + ncols,
+                'bytes_saved': sum(c['bytes_saved'] for c in ecols + ncols)
+            }
         storeEdgeAttributes(elist)
-        storeNodeAttributes(filtered_nlist, nodeid, node_map)
+        storeNodeAttributes(filtered_nlist, nodeid)
 
         return {'vgraph': vg, 'encodings': enc}
+
+
+def _frame_adapter(plotter, edges, nodes):
+    return (edges, plotter._table_frame(nodes))
+
+
+def _table_adapter(plotter, table, nodes):
+    return (plotter.arrow2pandas(table), plotter._table_frame(nodes))
+
+
+def _arrow_adapters():
+    import pyarrow
+    return {pyarrow.Table: _table_adapter, pyarrow.RecordBatch: _table_adapter}
+
+
+def _polars_adapters():
+    import polars
+    return {polars.DataFrame: _table_adapter}
+
+
+def _igraph_adapters():
+    import igraph
+    return {igraph.Graph: lambda plotter, graph, nodes: plotter.igraph2pandas(graph)}
+
+
+def _networkx_adapters():
+    import networkx
+    return {networkx.Graph: lambda plotter, graph, nodes: plotter.networkx2pandas(graph)}
+
+
+def _scipy_adapters():
+    import scipy.sparse
+    adapters = {scipy.sparse.spmatrix: Plotter.scipy2pandas}
+    if hasattr(scipy.sparse, 'sparray'):
+        adapters[scipy.sparse.sparray] = Plotter.scipy2pandas
+    return adapters
+
+
+Plotter._adapters[pandas.core.frame.DataFrame] = _frame_adapter
+Plotter._adapterLoaders.update({
+    'pyarrow': _arrow_adapters,
+    'polars': _polars_adapters,
+    'igraph': _igraph_adapters,
+    'networkx': _networkx_adapters,
+    'scipy': _scipy_adapters
+})
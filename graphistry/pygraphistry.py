@@ -7,12 +7,22 @@ standard_library.install_aliases()
 from builtins import object
 import sys
 import calendar
+import collections
+import itertools
+import numbers
 import time
-import gzip
+import hashlib
+import base64
 import io
 import json
+import os
+import uuid
+import zlib
 import requests
 import numpy
+import pandas
+from json.encoder import encode_basestring
+from multiprocessing.pool import ThreadPool
 
 from . import util
 
@@ -24,9 +34,45 @@ class PyGraphistry(object):
     _dataset_prefix = 'PyGraphistry/'
     _hostname = 'localhost:3000'
     _protocol = None
+    vgraph_version = None
+    _vgraph_max_version = 3
+    _server_vgraph_version = 0
+    stream_upload = False
+    _stream_chunk_size = 1024 * 1024
+    compression_workers = 1
+    _compression_block_size = 1024 * 1024
+    _json_chunk_rows = 10000
+    json_layout = 'records'
+    arrow_compression = None
+    downcast = False
+    downcast_report = None
+    _server_json_layouts = ['records']
+    compression_level = 9
+    bandwidth = None
+    compression_report = None
+    _measured_bandwidth = None
+    _default_bandwidth = 2 * 1024 * 1024
+    _compression_sample_size = 256 * 1024
+    pool_connections = 10
+    pool_maxsize = 10
+    keep_alive = True
+    _session = None
+    _plot_executor = None
+    cache = None
+    cache_size = 1000
+    cache_ttl = 7 * 24 * 3600
+    _uploaded_datasets = collections.OrderedDict()
+    chunk_size = None
+    checkpoint_dir = os.path.join(os.path.expanduser('~'), '.graphistry', 'uploads')
+    _chunk_retries = 3
 
     @staticmethod
-    def register(key, server='labs', protocol=None, api=1):
+    def register(key, server='labs', protocol=None, api=1, vgraph_version=None,
+                 stream_upload=False, compression_workers=1, compression_level=9, bandwidth=None,
+                 pool_connections=10, pool_maxsize=10, keep_alive=True,
+                 cache=None, cache_size=1000, cache_ttl=7 * 24 * 3600,
+                 chunk_size=None, checkpoint_dir=None, json_layout='records', arrow_compression=None,
+                 downcast=False):
         """API key registration and server selection
 
         Changing the key effects all derived Plotter instances.
@@ -37,6 +83,40 @@ class PyGraphistry(object):
         :type server: Optional string.
         :param protocol: Protocol used to contact visualization server
         :type protocol: Optional string.
+        :param api: Upload format: 1 for JSON, 2 for VectorGraph, 3 for Apache Arrow IPC tables (requires pyarrow).
+        :type api: Optional integer.
+        :param vgraph_version: VectorGraph schema version used by API 2 uploads. By default, the newest version supported by both the client and the server.
+        :type vgraph_version: Optional integer.
+        :param stream_upload: Serialize and compress datasets incrementally while uploading them, keeping memory use bounded instead of buffering the whole payload.
+        :type stream_upload: Optional boolean.
+        :param compression_workers: Number of threads compressing datasets. With more than one, the payload is compressed in blocks concurrently and sent as a multi-member gzip stream.
+        :type compression_workers: Optional integer.
+        :param compression_level: Gzip level from 1 to 9, or 'auto' to pick, for each upload, the level minimizing the estimated compression plus upload time. The level of the last gzipped payload, and under 'auto' its estimates, are kept in ``PyGraphistry.compression_report``, for its ``size`` bytes: the whole payload, or, for JSON, which is compressed as it is written and whose total size is not known in advance, the first chunk (``scope`` is then ``'first chunk'``). The report is None when the last payload was not gzipped.
+        :type compression_level: Optional integer or string.
+        :param bandwidth: Upload bandwidth in bytes per second used by 'auto' compression. By default, measured from previous uploads.
+        :type bandwidth: Optional number.
+        :param pool_connections: Number of hosts for which connections are pooled. All server calls and Plotter instances share the pool.
+        :type pool_connections: Optional integer.
+        :param pool_maxsize: Maximum number of connections kept open to a single host.
+        :type pool_maxsize: Optional integer.
+        :param keep_alive: Reuse connections across server calls instead of closing them after each request.
+        :type keep_alive: Optional boolean.
+        :param cache: Directory of an on-disk cache of uploads, or True for ``~/.graphistry/cache``. Plotting the same data with the same bindings again then reuses the uploaded dataset, without encoding or network traffic.
+        :type cache: Optional string or boolean.
+        :param cache_size: Maximum number of cached uploads. The least recently used ones are evicted first.
+        :type cache_size: Optional integer.
+        :param cache_ttl: Seconds after which a cached upload expires.
+        :type cache_ttl: Optional number.
+        :param chunk_size: Upload datasets in parts of this many bytes, each verified by checksum. Progress is checkpointed to disk, so plotting the same data again after an interrupted upload sends only the missing parts. Not supported with ``api=3``.
+        :type chunk_size: Optional integer.
+        :param checkpoint_dir: Directory holding checkpoints of chunked uploads. Defaults to ``~/.graphistry/uploads``.
+        :type checkpoint_dir: Optional string.
+        :param json_layout: Layout of API 1 datasets: 'records' sends one object per edge and node, 'columns' sends one array per attribute, without repeating attribute names. Columnar datasets are expanded back to records for servers that do not accept them.
+        :type json_layout: Optional string.
+        :param arrow_compression: Compression of the column buffers of Arrow uploads, 'lz4' or 'zstd'. Without it, Arrow tables are gzipped like other datasets.
+        :type arrow_compression: Optional string.
+        :param downcast: Send float64 columns of API 2 datasets as float32 when they fit: True for lossless narrowing only, or a relative error in [0, 1) to also accept float32 values within that error. Requires VectorGraph schema version 3. The bytes saved per column of the last dataset are kept in ``PyGraphistry.downcast_report``, or None when it was not downcast.
+        :type downcast: Optional boolean or number.
         :returns: None.
         :rtype: None.
 
@@ -65,6 +145,42 @@ class PyGraphistry(object):
         PyGraphistry.api_key = key.strip()
         PyGraphistry.api = api
         PyGraphistry._protocol = protocol
+        PyGraphistry.vgraph_version = vgraph_version
+        PyGraphistry.stream_upload = stream_upload
+        PyGraphistry.compression_workers = compression_workers
+        PyGraphistry.compression_level = compression_level
+        PyGraphistry.bandwidth = bandwidth
+        PyGraphistry.pool_connections = pool_connections
+        PyGraphistry.pool_maxsize = pool_maxsize
+        PyGraphistry.keep_alive = keep_alive
+        if cache is True:
+            cache = os.path.join(os.path.expanduser('~'), '.graphistry', 'cache')
+        PyGraphistry.cache = cache
+        PyGraphistry.cache_size = cache_size
+        PyGraphistry.cache_ttl = cache_ttl
+        PyGraphistry.chunk_size = chunk_size
+        if checkpoint_dir is not None:
+            PyGraphistry.checkpoint_dir = checkpoint_dir
+        if json_layout not in ('records', 'columns'):
+            raise ValueError('Unknown JSON layout:', json_layout)
+        if chunk_size and api == 3:
+            # The chunked upload protocol carries a single payload, and Arrow uploads have two
+            raise ValueError('chunk_size is not supported with api=3')
+        PyGraphistry.json_layout = json_layout
+        PyGraphistry.arrow_compression = arrow_compression
+        if downcast is None or isinstance(downcast, bool):
+            downcast = bool(downcast)
+        elif not isinstance(downcast, numbers.Real) or not 0 <= downcast < 1:
+            raise ValueError('downcast must be a boolean or a relative error in [0, 1):', downcast)
+        PyGraphistry.downcast = downcast
+        if PyGraphistry._session is not None:
+            PyGraphistry._session.close()
+            PyGraphistry._session = None
+        if PyGraphistry._plot_executor is not None:
+            PyGraphistry._plot_executor.shutdown(wait=False)
+            PyGraphistry._plot_executor = None
+        PyGraphistry._server_vgraph_version = 0
+        PyGraphistry._server_json_layouts = ['records']
         PyGraphistry._check_key()
 
     @staticmethod
@@ -114,6 +230,123 @@ class PyGraphistry(object):
         from . import plotter
         return plotter.Plotter().settings(height, url_params)
 
+    @staticmethod
+    def register_adapter(cls, adapter):
+        """Accept graphs of another type (and its subclasses) in plot(), edges() and graph().
+
+        Adapters for Pandas, Arrow, Polars, IGraph, NetworkX and SciPy are built in. Node tables of a type with an adapter are converted with it too, keeping its edge dataframe.
+
+        :param cls: Graph type.
+        :type cls: Class.
+        :param adapter: Function of a plotter, a graph and the nodes given with it (or None), returning a pair of edge and node dataframes (or None for nodes). Like the built-in converters, it may bind unbound attributes of the plotter.
+        :type adapter: Function.
+
+        **Example**
+                ::
+
+                    import graphistry
+                    import graph_tool
+
+                    def graph_tool2pandas(plotter, g, nodes):
+                        edges = pandas.DataFrame(g.get_edges(), columns=[plotter._source, plotter._destination])
+                        return (edges, nodes)
+
+                    graphistry.register_adapter(graph_tool.Graph, graph_tool2pandas)
+                    graphistry.bind(source='src', destination='dst').plot(g)
+
+        """
+
+        from . import plotter
+        with plotter.Plotter._adapterLock:
+            plotter.Plotter._adapters[cls] = adapter
+            plotter.Plotter._adapterCache.clear()
+
+    @staticmethod
+    def plot_batch(plotters, encode_workers=None, upload_workers=None):
+        """Upload many graphs concurrently.
+
+        Datasets are built and compressed on a process pool, and uploaded on a thread pool as soon as each one is ready. Uploads use the upload cache, re-binding and chunked uploads as ``plot()`` does. ``stream_upload`` does not apply, as workers return whole payloads.
+
+        :param plotters: Plotters to upload. An item may also be a tuple ``(plotter, graph)`` or ``(plotter, graph, nodes)``, as for ``plot()``.
+        :type plotters: List.
+        :param encode_workers: Number of encoding processes. Defaults to the number of cores.
+        :type encode_workers: Optional integer.
+        :param upload_workers: Number of concurrent uploads. Defaults to ``pool_maxsize``.
+        :type upload_workers: Optional integer.
+        :returns: For each item, in order, its visualization URL, or the exception raised while encoding or uploading it.
+        :rtype: List.
+
+        **Example**
+                ::
+
+                    import graphistry
+                    g = graphistry.bind(source='src', destination='dst')
+                    urls = graphistry.plot_batch([(g, es) for es in per_customer_edges])
+
+        """
+
+        from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+        items = [item if isinstance(item, tuple) else (item,) for item in plotters]
+        config = PyGraphistry._encoding_config()
+        encoders = ProcessPoolExecutor(max_workers=encode_workers)
+        uploaders = ThreadPoolExecutor(max_workers=upload_workers or PyGraphistry.pool_maxsize)
+        try:
+            encoded = [encoders.submit(_encode_batch_item, config, *item) for item in items]
+            uploads = [uploaders.submit(PyGraphistry._upload_encoded, item[0], future)
+                       for (item, future) in zip(items, encoded)]
+            results = []
+            for upload in uploads:
+                try:
+                    results.append(upload.result())
+                except Exception as e:
+                    results.append(e)
+            return results
+        finally:
+            encoders.shutdown()
+            uploaders.shutdown()
+
+    @staticmethod
+    def _encoding_config():
+        """Settings that encoding and upload keys depend on, for applying in worker processes."""
+        return {'hostname': PyGraphistry._hostname, 'api_key': PyGraphistry.api_key,
+                'cache': PyGraphistry.cache, 'chunk_size': PyGraphistry.chunk_size,
+                'api': PyGraphistry.api, 'vgraph_version': PyGraphistry._vgraph_version(),
+                'json_layout': PyGraphistry._json_layout(),
+                'arrow_compression': PyGraphistry.arrow_compression,
+                'downcast': PyGraphistry.downcast,
+                'compression_level': PyGraphistry.compression_level,
+                'bandwidth': PyGraphistry.bandwidth or PyGraphistry._measured_bandwidth}
+
+    @staticmethod
+    def _upload_encoded(plotter, encoded):
+        # Uploads go through the upload cache, re-binding and chunked uploads, as in plot()
+        encoded = encoded.result()
+        key = encoded['key']
+
+        def upload():
+            if encoded['api'] == 3:
+                return PyGraphistry._post_etl2_arrow(encoded['encodings'],
+                                                     io.BytesIO(encoded['data'][0]),
+                                                     io.BytesIO(encoded['data'][1]))
+            data = io.BytesIO(encoded['data'])
+            if encoded['api'] == 1:
+                if PyGraphistry.chunk_size:
+                    return PyGraphistry._chunked_etl1(data, key)
+                return PyGraphistry._post_etl1(data)
+            if PyGraphistry.chunk_size:
+                return PyGraphistry._chunked_etl2(encoded['encodings'], encoded['vgraph_version'], data, key)
+            return PyGraphistry._post_etl2(encoded['encodings'], encoded['vgraph_version'], data)
+
+        def rebound_upload():
+            if encoded['api'] == 1:
+                return upload()
+            return PyGraphistry._rebound_upload(encoded['rebind_key'], lambda: encoded['encodings'], upload)
+
+        info = PyGraphistry._cached_upload(key, rebound_upload)
+        viz_url = PyGraphistry._viz_url(info['name'], info['viztoken'], plotter._url_params)
+        return PyGraphistry._absolute_url(viz_url)
+
     @staticmethod
     def _etl_url(datatype):
         if datatype == 'json':
@@ -133,34 +366,543 @@ class PyGraphistry(object):
         return pattern % (PyGraphistry._hostname, dataset_name, PyGraphistry._tag,
                           token, splash_time, extra)
 
+    @staticmethod
+    def _absolute_url(viz_url):
+        return '%s:%s' % (PyGraphistry._protocol or 'http', viz_url)
+
+    @staticmethod
+    def _http():
+        """Shared requests session, pooling connections across all calls to the server."""
+        if PyGraphistry._session is None:
+            session = requests.Session()
+            adapter = requests.adapters.HTTPAdapter(pool_connections=PyGraphistry.pool_connections,
+                                                    pool_maxsize=PyGraphistry.pool_maxsize)
+            session.mount('http://', adapter)
+            session.mount('https://', adapter)
+            if not PyGraphistry.keep_alive:
+                session.headers['Connection'] = 'close'
+            PyGraphistry._session = session
+        return PyGraphistry._session
+
+    @staticmethod
+    def _executor():
+        """Thread pool running background plots, one worker per pooled connection."""
+        if PyGraphistry._plot_executor is None:
+            from concurrent.futures import ThreadPoolExecutor
+            PyGraphistry._plot_executor = ThreadPoolExecutor(max_workers=PyGraphistry.pool_maxsize)
+        return PyGraphistry._plot_executor
+
+    @staticmethod
+    def _vgraph_version():
+        if PyGraphistry.vgraph_version is not None:
+            return PyGraphistry.vgraph_version
+        return min(PyGraphistry._vgraph_max_version, PyGraphistry._server_vgraph_version)
+
+    @staticmethod
+    def _json_layout():
+        if PyGraphistry.json_layout in PyGraphistry._server_json_layouts:
+            return PyGraphistry.json_layout
+        return 'records'
+
+    @staticmethod
+    def _expand_columns(dataset):
+        """Convert a columnar ('edgelist_columns') dataset to the equivalent 'edgelist' one.
+        Its graph and labels may be DataFrames or dicts of column lists, as parsed from JSON."""
+        expanded = dict(dataset, type='edgelist')
+        for key in ('graph', 'labels'):
+            if key in expanded and not isinstance(expanded[key], pandas.DataFrame):
+                expanded[key] = pandas.DataFrame(collections.OrderedDict(expanded[key]))
+        return expanded
+
     @staticmethod
     def _get_data_file(dataset, mode):
-        out_file = io.BytesIO()
         if mode == 'json':
-            json_dataset = json.dumps(dataset, ensure_ascii=False, cls=NumpyJSONEncoder)
-            with gzip.GzipFile(fileobj=out_file, mode='w', compresslevel=9) as f:
-                if sys.version_info < (3,0) and isinstance(json_dataset, str):
-                    f.write(json_dataset)
-                else:
-                    f.write(json_dataset.encode('utf8'))
-        elif mode == 'vgraph':
-            bin_dataset = dataset.SerializeToString()
-            with gzip.GzipFile(fileobj=out_file, mode='w', compresslevel=9) as f:
-                f.write(bin_dataset)
+            # Compressed as it is written, so the full JSON text never sits in memory.
+            chunks = PyGraphistry._serialize_chunks(dataset, mode)
+            level = None
+        elif mode == 'vgraph' or mode == 'arrow':
+            if mode == 'vgraph':
+                data = dataset.SerializeToString()
+            else:
+                data = PyGraphistry._arrow_ipc(dataset)
+            level = None if PyGraphistry._skip_gzip(mode) else PyGraphistry._compression_level(data)
+            block_size = PyGraphistry._compression_block_size
+            view = memoryview(data)
+            chunks = (view[i:i + block_size] for i in range(0, len(data) or 1, block_size))
         else:
             raise ValueError('Unknown mode:', mode)
 
-        size = len(out_file.getvalue()) / 1024
+        out_file = io.BytesIO()
+        if PyGraphistry._skip_gzip(mode):
+            PyGraphistry.compression_report = None
+            pieces = chunks
+        else:
+            pieces = PyGraphistry._gzip_chunks(chunks, level)
+        for piece in pieces:
+            out_file.write(piece)
+
+        size = out_file.tell() / 1024
         if size >= 5 * 1024:
             print('Uploading %d kB. This may take a while...' % size)
             sys.stdout.flush()
         elif size > 50 * 1024:
             util.error('Dataset is too large (%d kB)!' % size)
 
+        out_file.seek(0)
         return out_file
 
     @staticmethod
-    def _etl1(dataset):
+    def _skip_gzip(mode):
+        """Whether a payload is already compressed, by Arrow's buffer compression."""
+        return mode == 'arrow' and PyGraphistry.arrow_compression is not None
+
+    @staticmethod
+    def _arrow_write_options():
+        import pyarrow
+        return pyarrow.ipc.IpcWriteOptions(compression=PyGraphistry.arrow_compression)
+
+    @staticmethod
+    def _arrow_ipc(table):
+        """Serialize an Arrow table as an IPC stream, returned as an Arrow buffer."""
+        import pyarrow
+        sink = pyarrow.BufferOutputStream()
+        writer = pyarrow.ipc.new_stream(sink, table.schema, options=PyGraphistry._arrow_write_options())
+        writer.write_table(table)
+        writer.close()
+        return sink.getvalue()
+
+    @staticmethod
+    def _serialize_chunks(dataset, mode):
+        """Yield the uncompressed dataset in pieces of roughly _stream_chunk_size bytes."""
+        chunk_size = PyGraphistry._stream_chunk_size
+        if mode == 'json':
+            buf = []
+            buf_len = 0
+            for piece in PyGraphistry._json_pieces(dataset):
+                buf.append(piece)
+                buf_len += len(piece)
+                if buf_len >= chunk_size:
+                    yield ''.join(buf).encode('utf8')
+                    buf = []
+                    buf_len = 0
+            if buf:
+                yield ''.join(buf).encode('utf8')
+        elif mode == 'vgraph':
+            # A message is valid as any concatenation of its encoded fields, so singular fields
+            # go first and repeated fields follow in pieces of at most chunk_size bytes, which
+            # are then joined into chunks of at most chunk_size bytes
+            (head, repeated) = PyGraphistry._message_fields(dataset)
+            pieces = itertools.chain([head], *[PyGraphistry._field_pieces(field, values, chunk_size)
+                                               for (field, values) in repeated])
+            buf = []
+            buf_len = 0
+            for piece in pieces:
+                if buf and buf_len + len(piece) > chunk_size:
+                    yield b''.join(buf)
+                    buf = []
+                    buf_len = 0
+                buf.append(piece)
+                buf_len += len(piece)
+            if buf:
+                yield b''.join(buf)
+        elif mode == 'arrow':
+            # An IPC stream is a schema message followed by one message per record batch
+            import pyarrow
+            rows = max(1, chunk_size * dataset.num_rows // max(1, dataset.nbytes))
+            sink = io.BytesIO()
+            writer = pyarrow.ipc.new_stream(sink, dataset.schema,
+                                            options=PyGraphistry._arrow_write_options())
+            for batch in dataset.to_batches(max_chunksize=rows):
+                writer.write_batch(batch)
+                if sink.tell() >= chunk_size:
+                    yield sink.getvalue()
+                    sink.seek(0)
+                    sink.truncate()
+            writer.close()
+            yield sink.getvalue()
+        else:
+            raise ValueError('Unknown mode:', mode)
+
+    @staticmethod
+    def _message_fields(msg):
+        """Encoded singular fields of a protobuf message, and its repeated fields."""
+        head = type(msg)()
+        repeated = []
+        for (field, value) in msg.ListFields():
+            if hasattr(value, 'extend'):
+                repeated.append((field, value))
+            elif field.message_type is not None:
+                getattr(head, field.name).CopyFrom(value)
+            else:
+                setattr(head, field.name, value)
+        return (head.SerializePartialToString(), repeated)
+
+    @staticmethod
+    def _packed_slices(field, values, chunk_size):
+        """Packed encodings of consecutive slices of a repeated number field.
+
+        A packed field may occur several times, its values being concatenated, so each slice is a
+        field of its own. Varints take at most 10 bytes, so no slice exceeds chunk_size.
+        """
+        from google.protobuf.descriptor import FieldDescriptor as FD
+        fixed = {FD.TYPE_DOUBLE: '<f8', FD.TYPE_FLOAT: '<f4', FD.TYPE_FIXED32: '<u4',
+                 FD.TYPE_FIXED64: '<u8', FD.TYPE_SFIXED32: '<i4', FD.TYPE_SFIXED64: '<i8'}
+        signed = [FD.TYPE_INT32, FD.TYPE_INT64, FD.TYPE_ENUM]
+        dtype = fixed.get(field.type)
+        step = max(1, (chunk_size - 16) // (10 if dtype is None else numpy.dtype(dtype).itemsize))
+        for start in range(0, len(values), step):
+            if dtype is not None:
+                payload = numpy.array(values[start:start + step], dtype=dtype).tobytes()
+            else:
+                # Negative numbers are sign-extended to 64 bits, as protobuf encodes them
+                ints = numpy.array(values[start:start + step],
+                                   dtype=numpy.int64 if field.type in signed else numpy.uint64)
+                payload = util.encode_varints(ints.view(numpy.uint64))
+            yield util.encode_packed(field.number, payload)
+
+    @staticmethod
+    def _field_pieces(field, values, chunk_size):
+        """Encoding of a repeated protobuf field in pieces of at most about chunk_size bytes.
+
+        Embedded messages larger than that are written as their length followed by the pieces
+        of their own fields.
+        """
+        from google.protobuf.descriptor import FieldDescriptor as FD
+        tag = util.encode_varint((field.number << 3) | 2)
+        if field.message_type is not None:
+            for msg in values:
+                size = msg.ByteSize()
+                if size <= chunk_size:
+                    yield tag + util.encode_varint(size) + msg.SerializePartialToString()
+                    continue
+                (head, repeated) = PyGraphistry._message_fields(msg)
+                size = len(head) + sum(PyGraphistry._field_size(f, v, chunk_size) for (f, v) in repeated)
+                yield tag + util.encode_varint(size) + head
+                for (f, v) in repeated:
+                    for piece in PyGraphistry._field_pieces(f, v, chunk_size):
+                        yield piece
+        elif field.type in (FD.TYPE_STRING, FD.TYPE_BYTES):
+            buf = []
+            buf_len = 0
+            for value in values:
+                data = value if field.type == FD.TYPE_BYTES else value.encode('utf8')
+                piece = tag + util.encode_varint(len(data)) + data
+                if buf and buf_len + len(piece) > chunk_size:
+                    yield b''.join(buf)
+                    buf = []
+                    buf_len = 0
+                buf.append(piece)
+                buf_len += len(piece)
+            if buf:
+                yield b''.join(buf)
+        else:
+            for piece in PyGraphistry._packed_slices(field, values, chunk_size):
+                yield piece
+
+    @staticmethod
+    def _field_size(field, values, chunk_size):
+        """Number of bytes _field_pieces writes for a repeated protobuf field."""
+        return sum(len(piece) for piece in PyGraphistry._field_pieces(field, values, chunk_size))
+
+    @staticmethod
+    def _json_pieces(dataset):
+        """Yield the JSON text of a dataset dict. DataFrame values are written as arrays of row
+        objects, built column by column rather than through a dict per row."""
+        encoder = NumpyJSONEncoder(ensure_ascii=False)
+        if dataset.get('type') == 'edgelist_columns':
+            write_frame = PyGraphistry._json_columns
+        else:
+            write_frame = PyGraphistry._json_records
+        yield '{'
+        for (i, (key, value)) in enumerate(dataset.items()):
+            yield (', ' if i else '') + encoder.encode(key) + ': '
+            if isinstance(value, pandas.DataFrame):
+                for piece in write_frame(value):
+                    yield piece
+            else:
+                yield encoder.encode(value)
+        yield '}'
+
+    @staticmethod
+    def _json_records(df):
+        """Yield a frame as a JSON array of row objects, _json_chunk_rows rows at a time."""
+        keys = [json.dumps(u'%s' % c, ensure_ascii=False) + ': ' for c in df.columns]
+        rows = PyGraphistry._json_chunk_rows
+        yield '['
+        for start in range(0, len(df), rows):
+            part = df.iloc[start:start + rows]
+            if keys:
+                line = None
+                for (key, col) in zip(keys, df.columns):
+                    pairs = key + PyGraphistry._json_values(part[col])
+                    line = pairs if line is None else line + ', ' + pairs
+                objs = '{' + line + '}'
+            else:
+                objs = ['{}'] * len(part)
+            yield (', ' if start else '') + ', '.join(objs)
+        yield ']'
+
+    @staticmethod
+    def _json_columns(df):
+        """Yield a frame as a JSON object mapping each column name to the array of its values."""
+        rows = PyGraphistry._json_chunk_rows
+        yield '{'
+        for (i, col) in enumerate(df.columns):
+            yield (', ' if i else '') + json.dumps(u'%s' % col, ensure_ascii=False) + ': ['
+            for start in range(0, len(df), rows):
+                values = PyGraphistry._json_values(df[col].iloc[start:start + rows])
+                yield (', ' if start else '') + ', '.join(values)
+            yield ']'
+        yield '}'
+
+    @staticmethod
+    def _json_values(col):
+        """JSON literals of a column as an object array, with missing values as null."""
+        col = util.numpy_column(col)
+        values = col.values
+        kind = col.dtype.kind
+        if kind == 'b':
+            out = numpy.where(values, 'true', 'false').astype(object)
+        elif kind in 'iu':
+            out = numpy.array([str(v) for v in values.tolist()], dtype=object)
+        elif kind == 'f':
+            out = numpy.array([repr(v) for v in values.tolist()], dtype=object)
+            out[numpy.isposinf(values)] = 'Infinity'
+            out[numpy.isneginf(values)] = '-Infinity'
+        else:
+            encoder = NumpyJSONEncoder(ensure_ascii=False)
+            text = type(u'')
+            out = numpy.array([encode_basestring(v) if isinstance(v, text) else encoder.encode(v)
+                               for v in values], dtype=object)
+        out[numpy.asarray(pandas.isnull(values), dtype=bool)] = 'null'
+        return out
+
+    @staticmethod
+    def _gzip_member(data, level):
+        compressor = zlib.compressobj(level, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+        return compressor.compress(data) + compressor.flush()
+
+    @staticmethod
+    def _gzip_members(chunks, level, workers):
+        """Compress chunks concurrently as separate gzip members, yielding them in order.
+
+        At most workers + 1 chunks are in flight, so lazily produced chunks stay lazy.
+        """
+        pool = ThreadPool(workers)
+        try:
+            pending = collections.deque()
+            for chunk in chunks:
+                pending.append(pool.apply_async(PyGraphistry._gzip_member, (chunk, level)))
+                if len(pending) > workers:
+                    yield pending.popleft().get()
+            while pending:
+                yield pending.popleft().get()
+        finally:
+            pool.terminate()
+
+    @staticmethod
+    def _compression_level(data, total_size=None):
+        """Configured gzip level, or under 'auto' the level with the lowest estimated compression
+        plus upload time, extrapolated from trial compressions of a sample of data. Either way, it
+        is recorded in compression_report."""
+        view = memoryview(data)
+        total_size = len(view) if total_size is None else total_size
+        if PyGraphistry.compression_level != 'auto':
+            PyGraphistry.compression_report = {'level': PyGraphistry.compression_level, 'size': total_size,
+                                               'scope': 'payload', 'bandwidth': None, 'estimates': None}
+            return PyGraphistry.compression_level
+
+        n = PyGraphistry._compression_sample_size
+        if len(view) > 3 * n:
+            mid = len(view) // 2
+            sample = b''.join([view[:n], view[mid:mid + n], view[-n:]])
+        else:
+            sample = view.tobytes()
+        sample_size = max(len(sample), 1)
+        bandwidth = PyGraphistry.bandwidth or PyGraphistry._measured_bandwidth or \
+                    PyGraphistry._default_bandwidth
+
+        estimates = {}
+        for level in (1, 3, 6, 9):
+            start = time.time()
+            ratio = float(len(zlib.compress(sample, level))) / sample_size
+            elapsed = time.time() - start
+            estimates[level] = {
+                'ratio': ratio,
+                'compress_seconds': total_size * elapsed / sample_size / PyGraphistry.compression_workers,
+                'upload_seconds': total_size * ratio / bandwidth
+            }
+        best = min(estimates, key=lambda l: estimates[l]['compress_seconds'] + estimates[l]['upload_seconds'])
+        PyGraphistry.compression_report = {'level': best, 'size': total_size, 'scope': 'payload',
+                                           'bandwidth': bandwidth, 'estimates': estimates}
+        return best
+
+    @staticmethod
+    def _record_bandwidth(out_files, elapsed):
+        # Small uploads mostly measure latency, not bandwidth
+        size = 0
+        for out_file in out_files:
+            out_file.seek(0, io.SEEK_END)
+            size += out_file.tell()
+        if size >= 256 * 1024 and elapsed > 0:
+            PyGraphistry._measured_bandwidth = size / elapsed
+
+    @staticmethod
+    def _gzip_chunks(chunks, level=None, total_size=None):
+        """Gzip an iterable of byte chunks lazily. Without an explicit level, the configured one is
+        used, with 'auto' deciding on the first chunk. Its estimates are for total_size bytes, when
+        the size of the whole payload is known or estimated, or else for the first chunk."""
+        if level is None:
+            chunks = iter(chunks)
+            first = next(chunks, b'')
+            level = PyGraphistry._compression_level(first, total_size)
+            if total_size is None:
+                PyGraphistry.compression_report['scope'] = 'first chunk'
+            chunks = itertools.chain([first], chunks)
+        if PyGraphistry.compression_workers > 1:
+            for member in PyGraphistry._gzip_members(chunks, level, PyGraphistry.compression_workers):
+                yield member
+            return
+        compressor = zlib.compressobj(level, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+        for chunk in chunks:
+            out = compressor.compress(chunk)
+            if out:
+                yield out
+        yield compressor.flush()
+
+    @staticmethod
+    def _iter_chunks(data):
+        """Chunks of a file object, or the given iterable of chunks."""
+        if hasattr(data, 'read'):
+            return iter(lambda: data.read(PyGraphistry._stream_chunk_size), b'')
+        return data
+
+    @staticmethod
+    def _multipart_chunks(parts, boundary):
+        """Yield a multipart/form-data body; each part is (name, content type, iterable of byte chunks)."""
+        for (name, content_type, chunks) in parts:
+            head = '--%s\r\nContent-Disposition: form-data; name="%s"; filename="%s"\r\n' \
+                   'Content-Type: %s\r\n\r\n' % (boundary, name, name, content_type)
+            yield head.encode('utf8')
+            for chunk in chunks:
+                yield chunk
+            yield b'\r\n'
+        yield ('--%s--\r\n' % boundary).encode('utf8')
+
+    @staticmethod
+    def _cache_index_path():
+        return os.path.join(PyGraphistry.cache, 'uploads.json')
+
+    @staticmethod
+    def _cache_load():
+        try:
+            with open(PyGraphistry._cache_index_path()) as f:
+                index = json.load(f)
+        except (IOError, ValueError):
+            return {}
+        now = time.time()
+        return dict([(k, v) for (k, v) in index.items()
+                     if now - v['created'] < PyGraphistry.cache_ttl])
+
+    @staticmethod
+    def _cache_store(index):
+        if len(index) > PyGraphistry.cache_size:
+            recent = sorted(index, key=lambda k: index[k]['used'], reverse=True)
+            index = dict([(k, index[k]) for k in recent[:PyGraphistry.cache_size]])
+        if not os.path.isdir(PyGraphistry.cache):
+            os.makedirs(PyGraphistry.cache)
+        # Write then rename, so concurrent readers never see a partial index
+        path = PyGraphistry._cache_index_path()
+        tmp = '%s.%s' % (path, uuid.uuid4().hex)
+        with open(tmp, 'w') as f:
+            json.dump(index, f)
+        try:
+            os.replace(tmp, path)
+        except AttributeError:
+            if os.path.exists(path):
+                os.remove(path)
+            os.rename(tmp, path)
+
+    @staticmethod
+    def _cache_get(key):
+        index = PyGraphistry._cache_load()
+        entry = index.get(key)
+        if entry is None:
+            return None
+        entry['used'] = time.time()
+        PyGraphistry._cache_store(index)
+        return {'name': entry['name'], 'viztoken': entry['viztoken']}
+
+    @staticmethod
+    def _cache_put(key, info):
+        index = PyGraphistry._cache_load()
+        now = time.time()
+        index[key] = {'name': info['name'], 'viztoken': info['viztoken'],
+                      'created': now, 'used': now}
+        PyGraphistry._cache_store(index)
+
+    @staticmethod
+    def _cached_upload(key, upload):
+        """Dataset of key in the upload cache, or of an interrupted chunked upload of it, or else the
+        result of upload(), which is then cached under key."""
+        info = PyGraphistry._cache_get(key) if key and PyGraphistry.cache else None
+        if info is None:
+            # Only uploads are cached, so cache_ttl counts from the upload, not from the last use
+            if key and PyGraphistry.chunk_size:
+                info = PyGraphistry._resume_upload(key)
+            if info is None:
+                info = upload()
+            if key and PyGraphistry.cache:
+                PyGraphistry._cache_put(key, info)
+        return info
+
+    @staticmethod
+    def _rebound_upload(key, encodings, upload):
+        """Dataset of the view encodings() bound to the dataset uploaded under key, or else the result
+        of upload(), whose dataset is then remembered under key.
+
+        API 2 keeps visual encodings out of the vgraph (or, with API 3, Arrow tables), so a dataset
+        already uploaded with the same structural bindings only needs its encodings sent again.
+        """
+        name = PyGraphistry._uploaded_datasets.get(key) if key else None
+        if name is not None:
+            try:
+                return PyGraphistry._etl2_rebind(encodings(), name)
+            except (requests.exceptions.RequestException, ValueError):
+                PyGraphistry._uploaded_datasets.pop(key, None)
+
+        info = upload()
+        if key:
+            PyGraphistry._remember_dataset(key, info['name'])
+        return info
+
+    @staticmethod
+    def _remember_dataset(key, name):
+        datasets = PyGraphistry._uploaded_datasets
+        datasets.pop(key, None)
+        datasets[key] = name
+        while len(datasets) > PyGraphistry.cache_size:
+            datasets.popitem(last=False)
+
+    @staticmethod
+    def _etl1(dataset, resume_key=None):
+        if dataset.get('type') == 'edgelist_columns' and PyGraphistry._json_layout() != 'columns':
+            dataset = PyGraphistry._expand_columns(dataset)
+        if PyGraphistry.chunk_size:
+            return PyGraphistry._chunked_etl1(PyGraphistry._get_data_file(dataset, 'json'), resume_key)
+        if PyGraphistry.stream_upload:
+            body = PyGraphistry._gzip_chunks(PyGraphistry._serialize_chunks(dataset, 'json'))
+        else:
+            body = PyGraphistry._get_data_file(dataset, 'json')
+        return PyGraphistry._post_etl1(body)
+
+    @staticmethod
+    def _chunked_etl1(out_file, resume_key):
+        return PyGraphistry._upload_chunked(out_file, {'apiversion': '1'}, None, resume_key)
+
+    @staticmethod
+    def _post_etl1(body):
+        """Upload a gzipped JSON dataset, given as a file object or an iterable of chunks."""
         if PyGraphistry.api_key is None:
             raise ValueError('API key required')
 
@@ -169,9 +911,11 @@ class PyGraphistry(object):
                   'agentversion': sys.modules['graphistry'].__version__,
                   'key': PyGraphistry.api_key}
 
-        out_file = PyGraphistry._get_data_file(dataset, 'json')
-        response = requests.post(PyGraphistry._etl_url('json'), out_file.getvalue(),
-                                 headers=headers, params=params)
+        start = time.time()
+        response = PyGraphistry._http().post(PyGraphistry._etl_url('json'), body,
+                                             headers=headers, params=params)
+        if hasattr(body, 'seek'):
+            PyGraphistry._record_bandwidth([body], time.time() - start)
         response.raise_for_status()
 
         jres = response.json()
@@ -181,30 +925,249 @@ class PyGraphistry(object):
             return {'name': jres['dataset'], 'viztoken': jres['viztoken']}
 
     @staticmethod
-    def _etl2(encodings, vgraph):
-        if PyGraphistry.api_key is None:
-            raise ValueError('API key required')
+    def _etl2(encodings, vgraph, resume_key=None):
+        if PyGraphistry.chunk_size:
+            return PyGraphistry._chunked_etl2(encodings, vgraph.version,
+                                              PyGraphistry._get_data_file(vgraph, 'vgraph'), resume_key)
+        if PyGraphistry.stream_upload:
+            data0 = PyGraphistry._gzip_chunks(PyGraphistry._serialize_chunks(vgraph, 'vgraph'),
+                                              total_size=vgraph.ByteSize())
+        else:
+            data0 = PyGraphistry._get_data_file(vgraph, 'vgraph')
+        return PyGraphistry._post_etl2(encodings, vgraph.version, data0)
+
+    @staticmethod
+    def _chunked_etl2(encodings, vgraph_version, out_file, resume_key):
+        metadata = PyGraphistry._view_metadata(encodings, [{'type': 'vgraph', 'url': 'data0'}])
+        return PyGraphistry._upload_chunked(out_file, {'apiversion': '2', 'vgraphversion': str(vgraph_version)},
+                                            metadata, resume_key)
+
+    @staticmethod
+    def _post_etl2(encodings, vgraph_version, data0):
+        """Upload view encodings and a gzipped vgraph, given as a file object or an iterable of chunks."""
+        return PyGraphistry._post_datasources(encodings, [({'type': 'vgraph'}, data0)],
+                                              {'vgraphversion': str(vgraph_version)})
 
-        metadata = {
-            'datasources': [
-                {'type': 'vgraph', 'url': 'data0'}
-            ],
+    @staticmethod
+    def _etl2_arrow(encodings, edges, nodes):
+        if PyGraphistry.stream_upload:
+            def payload(table):
+                chunks = PyGraphistry._serialize_chunks(table, 'arrow')
+                if PyGraphistry._skip_gzip('arrow'):
+                    PyGraphistry.compression_report = None
+                    return chunks
+                # Buffer sizes approximate the stream's
+                return PyGraphistry._gzip_chunks(chunks, total_size=table.nbytes)
+        else:
+            def payload(table):
+                return PyGraphistry._get_data_file(table, 'arrow')
+        return PyGraphistry._post_etl2_arrow(encodings, payload(edges), payload(nodes))
+
+    @staticmethod
+    def _post_etl2_arrow(encodings, edges, nodes):
+        """Upload view encodings with edge and node tables as Arrow IPC streams, each given as a file
+        object or an iterable of chunks."""
+        compression = PyGraphistry.arrow_compression
+        sources = [({'type': 'arrow', 'role': role, 'compression': compression or 'gzip'}, data)
+                   for (role, data) in [('edges', edges), ('nodes', nodes)]]
+        return PyGraphistry._post_datasources(encodings, sources, {})
+
+    @staticmethod
+    def _view_metadata(encodings, datasources):
+        """Metadata of an API 2 upload: its datasources and view encodings."""
+        return {
+            'datasources': datasources,
             'view': {
                 'encodings': encodings
             },
             'types': {}
         }
 
-        out_file = PyGraphistry._get_data_file(vgraph, 'vgraph')
+    @staticmethod
+    def _post_datasources(encodings, sources, extra_params):
+        """Upload view encodings and datasources in an API 2 multipart body. Each source is a pair of
+        its metadata and its data, a file object or an iterable of chunks, sent as part data<i>."""
+        if PyGraphistry.api_key is None:
+            raise ValueError('API key required')
+
+        metadata = PyGraphistry._view_metadata(
+            encodings, [dict(source, url='data%d' % i) for (i, (source, _)) in enumerate(sources)])
+
+        params = {'usertag': PyGraphistry._tag, 'agent': 'pygraphistry', 'apiversion' : '2',
+                  'agentversion': sys.modules['graphistry'].__version__,
+                  'key': PyGraphistry.api_key}
+        params.update(extra_params)
+        if all(hasattr(data, 'seek') for (_, data) in sources):
+            parts = collections.OrderedDict()
+            parts['metadata'] = ('metadata', json.dumps(metadata, ensure_ascii=False), 'application/json')
+            for (i, (_, data)) in enumerate(sources):
+                parts['data%d' % i] = ('data%d' % i, data, 'application/octet-stream')
+            start = time.time()
+            response = PyGraphistry._http().post(PyGraphistry._etl_url('json'), files=list(parts.items()),
+                                                 params=params)
+            PyGraphistry._record_bandwidth([data for (_, data) in sources], time.time() - start)
+        else:
+            boundary = uuid.uuid4().hex
+            body = PyGraphistry._multipart_chunks(
+                [('metadata', 'application/json', [json.dumps(metadata, ensure_ascii=False).encode('utf8')])] +
+                [('data%d' % i, 'application/octet-stream', PyGraphistry._iter_chunks(data))
+                 for (i, (_, data)) in enumerate(sources)], boundary)
+            headers = {'Content-Type': 'multipart/form-data; boundary=%s' % boundary}
+            response = PyGraphistry._http().post(PyGraphistry._etl_url('json'), body,
+                                                 headers=headers, params=params)
+        response.raise_for_status()
+
+        jres = response.json()
+        if jres['success'] is not True:
+            raise ValueError('Server reported error:', jres['msg'] if 'msg' in jres else 'No Message')
+        else:
+            return {'name': jres['dataset'], 'viztoken': jres['viztoken']}
+
+    @staticmethod
+    def _upload_url(*path):
+        return '/'.join(['http://%s/etl/uploads' % PyGraphistry._hostname] + [str(p) for p in path])
+
+    @staticmethod
+    def _upload_params(extra):
+        params = {'usertag': PyGraphistry._tag, 'agent': 'pygraphistry',
+                  'agentversion': sys.modules['graphistry'].__version__,
+                  'key': PyGraphistry.api_key}
+        params.update(extra)
+        return params
+
+    @staticmethod
+    def _checkpoint_paths(key):
+        base = os.path.join(PyGraphistry.checkpoint_dir, key)
+        return (base + '.json', base + '.gz')
+
+    @staticmethod
+    def _save_checkpoint(key, checkpoint):
+        (path, _) = PyGraphistry._checkpoint_paths(key)
+        with open(path, 'w') as f:
+            json.dump(checkpoint, f)
+
+    @staticmethod
+    def _upload_chunked(data_file, extra_params, metadata, resume_key):
+        """Resumable upload of a gzipped dataset in checksummed parts.
+
+        The server protocol is:
+
+        - ``POST /etl/uploads`` with the payload size and part count opens an upload and returns its id.
+        - ``PUT /etl/uploads/<id>/<part>`` sends one part, with its MD5 in ``Content-MD5``.
+        - ``GET /etl/uploads/<id>`` lists the parts received so far, for resuming.
+        - ``POST /etl/uploads/<id>/commit`` assembles the parts and returns the dataset as ``/etl`` does.
+
+        The payload and the list of acknowledged parts are checkpointed under resume_key (by default
+        the payload hash) until the upload is committed.
+        """
+        if PyGraphistry.api_key is None:
+            raise ValueError('API key required')
+
+        payload = data_file.getvalue()
+        key = resume_key or hashlib.sha1(payload).hexdigest()
+        size = PyGraphistry.chunk_size
+        checksums = [base64.b64encode(hashlib.md5(payload[i:i + size]).digest()).decode('ascii')
+                     for i in range(0, len(payload) or 1, size)]
+
+        response = PyGraphistry._http().post(PyGraphistry._upload_url(),
+                                             json={'size': len(payload), 'parts': len(checksums)},
+                                             params=PyGraphistry._upload_params(extra_params))
+        response.raise_for_status()
+        jres = response.json()
+        if jres['success'] is not True:
+            raise ValueError('Server reported error:', jres['msg'] if 'msg' in jres else 'No Message')
+
+        checkpoint = {'upload': jres['upload'], 'part_size': size, 'checksums': checksums,
+                      'acked': [], 'params': extra_params, 'metadata': metadata}
+        if not os.path.isdir(PyGraphistry.checkpoint_dir):
+            os.makedirs(PyGraphistry.checkpoint_dir)
+        (_, payload_path) = PyGraphistry._checkpoint_paths(key)
+        with open(payload_path, 'wb') as f:
+            f.write(payload)
+        PyGraphistry._save_checkpoint(key, checkpoint)
+        return PyGraphistry._finish_chunked(key, checkpoint, payload)
+
+    @staticmethod
+    def _resume_upload(key):
+        """Finish an interrupted chunked upload checkpointed under key, or return None if there is none."""
+        (path, payload_path) = PyGraphistry._checkpoint_paths(key)
+        try:
+            with open(path) as f:
+                checkpoint = json.load(f)
+            with open(payload_path, 'rb') as f:
+                payload = f.read()
+        except (IOError, ValueError):
+            return None
+
+        try:
+            response = PyGraphistry._http().get(PyGraphistry._upload_url(checkpoint['upload']),
+                                                params=PyGraphistry._upload_params(checkpoint['params']))
+            response.raise_for_status()
+            jres = response.json()
+            if jres['success'] is not True:
+                raise ValueError('Server reported error:', jres['msg'] if 'msg' in jres else 'No Message')
+        except (requests.exceptions.RequestException, ValueError):
+            # The server no longer knows this upload, start over
+            PyGraphistry._discard_checkpoint(key)
+            return None
+
+        checkpoint['acked'] = jres['received']
+        return PyGraphistry._finish_chunked(key, checkpoint, payload)
+
+    @staticmethod
+    def _finish_chunked(key, checkpoint, payload):
+        upload = checkpoint['upload']
+        size = checkpoint['part_size']
+        params = PyGraphistry._upload_params(checkpoint['params'])
+        for (part, checksum) in enumerate(checkpoint['checksums']):
+            if part in checkpoint['acked']:
+                continue
+            for attempt in range(PyGraphistry._chunk_retries):
+                try:
+                    response = PyGraphistry._http().put(PyGraphistry._upload_url(upload, part),
+                                                        payload[part * size:(part + 1) * size],
+                                                        headers={'Content-MD5': checksum,
+                                                                 'Content-Type': 'application/octet-stream'},
+                                                        params=params)
+                    response.raise_for_status()
+                    break
+                except requests.exceptions.RequestException:
+                    if attempt + 1 == PyGraphistry._chunk_retries:
+                        raise
+            checkpoint['acked'].append(part)
+            PyGraphistry._save_checkpoint(key, checkpoint)
+
+        body = {} if checkpoint['metadata'] is None else {'metadata': checkpoint['metadata']}
+        response = PyGraphistry._http().post(PyGraphistry._upload_url(upload, 'commit'),
+                                             json=body, params=params)
+        response.raise_for_status()
+        jres = response.json()
+        if jres['success'] is not True:
+            raise ValueError('Server reported error:', jres['msg'] if 'msg' in jres else 'No Message')
+        PyGraphistry._discard_checkpoint(key)
+        return {'name': jres['dataset'], 'viztoken': jres['viztoken']}
+
+    @staticmethod
+    def _discard_checkpoint(key):
+        for path in PyGraphistry._checkpoint_paths(key):
+            if os.path.exists(path):
+                os.remove(path)
+
+    @staticmethod
+    def _etl2_rebind(encodings, dataset_name):
+        """Create a new visualization of an already uploaded dataset, sending only view encodings."""
+        if PyGraphistry.api_key is None:
+            raise ValueError('API key required')
+
+        metadata = PyGraphistry._view_metadata(encodings, [{'type': 'dataset', 'name': dataset_name}])
         parts = {
-            'metadata': ('metadata', json.dumps(metadata, ensure_ascii=False), 'application/json'),
-            'data0': ('data0', out_file.getvalue(), 'application/octet-stream')
+            'metadata': ('metadata', json.dumps(metadata, ensure_ascii=False), 'application/json')
         }
-
         params = {'usertag': PyGraphistry._tag, 'agent': 'pygraphistry', 'apiversion' : '2',
                   'agentversion': sys.modules['graphistry'].__version__,
                   'key': PyGraphistry.api_key}
-        response = requests.post(PyGraphistry._etl_url('json'), files=parts, params=params)
+        response = PyGraphistry._http().post(PyGraphistry._etl_url('json'), files=parts,
+                                             params=params)
         response.raise_for_status()
 
         jres = response.json()
@@ -217,12 +1180,15 @@ class PyGraphistry(object):
     def _check_key():
         params = {'text': PyGraphistry.api_key}
         try:
-            response = requests.get(PyGraphistry._check_url(), params=params,
-                                    timeout=(2,1))
+            response = PyGraphistry._http().get(PyGraphistry._check_url(), params=params,
+                                                timeout=(2,1))
             response.raise_for_status()
             jres = response.json()
             if jres['success'] is not True:
                 util.warn(jres['error'])
+            # Servers that accept packed edge arrays advertise their newest VectorGraph version
+            PyGraphistry._server_vgraph_version = int(jres.get('vgraphversion', 0))
+            PyGraphistry._server_json_layouts = jres.get('jsonlayouts', ['records'])
         except Exception as e:
             pass
 
@@ -232,6 +1198,23 @@ edges = PyGraphistry.edges
 nodes = PyGraphistry.nodes
 graph = PyGraphistry.graph
 settings = PyGraphistry.settings
+register_adapter = PyGraphistry.register_adapter
+plot_batch = PyGraphistry.plot_batch
+
+
+def _encode_batch_item(config, plotter, graph=None, nodes=None):
+    PyGraphistry._hostname = config['hostname']
+    PyGraphistry.api_key = config['api_key']
+    PyGraphistry.cache = config['cache']
+    PyGraphistry.chunk_size = config['chunk_size']
+    PyGraphistry.api = config['api']
+    PyGraphistry.vgraph_version = config['vgraph_version']
+    PyGraphistry.json_layout = config['json_layout']
+    PyGraphistry.arrow_compression = config['arrow_compression']
+    PyGraphistry.downcast = config['downcast']
+    PyGraphistry.compression_level = config['compression_level']
+    PyGraphistry.bandwidth = config['bandwidth']
+    return plotter._encode(graph, nodes)
 
 
 class NumpyJSONEncoder(json.JSONEncoder):
@@ -5,6 +5,8 @@ import sys
 import platform as p
 import uuid
 import hashlib
+import numpy
+import pandas
 
 def make_iframe(raw_url, height, protocol=None):
     id = uuid.uuid4()
@@ -54,3 +56,74 @@ def error(msg):
         import IPython
         IPython.utils.warn.error(msg)
     raise ValueError(msg)
+
+def varint_lengths(values):
+    """Number of bytes taken by each value of an unsigned integer array once varint encoded."""
+    values = numpy.asarray(values).astype(numpy.uint64)
+    lengths = numpy.ones(len(values), dtype=numpy.int64)
+    for shift in range(7, 64, 7):
+        lengths += values >= (numpy.uint64(1) << numpy.uint64(shift))
+    return lengths
+
+def write_varints(buf, offsets, values, lengths):
+    """Write protobuf varints for all values into the uint8 array buf, starting at the given offsets."""
+    values = numpy.asarray(values).astype(numpy.uint64)
+    for k in range(int(lengths.max()) if len(lengths) else 0):
+        mask = lengths > k
+        byte = (values[mask] >> numpy.uint64(7 * k)) & numpy.uint64(0x7f)
+        byte |= numpy.where(lengths[mask] > k + 1, 0x80, 0).astype(numpy.uint64)
+        buf[offsets[mask] + k] = byte
+
+def encode_varints(values):
+    """Concatenated protobuf varints of an unsigned integer array (the body of a packed field)."""
+    values = numpy.asarray(values, dtype=numpy.uint64)
+    if len(values) and values.max() < 0x80:
+        return values.astype(numpy.uint8).tobytes()
+    lengths = varint_lengths(values)
+    ends = numpy.cumsum(lengths)
+    buf = numpy.zeros(ends[-1] if len(ends) else 0, dtype=numpy.uint8)
+    write_varints(buf, ends - lengths, values, lengths)
+    return buf.tobytes()
+
+def encode_varint(value):
+    """Protobuf varint of one unsigned integer."""
+    out = bytearray()
+    while value >= 0x80:
+        out.append((value & 0x7f) | 0x80)
+        value >>= 7
+    out.append(value)
+    return bytes(out)
+
+def encode_packed(field_number, payload):
+    """Protobuf encoding of a length-delimited field (tag, length, payload), e.g. a packed repeated field."""
+    header = encode_varints([(field_number << 3) | 2, len(payload)])
+    return header + payload
+
+
+def is_arrow_column(col):
+    """Whether a series holds Arrow-backed values (``pandas.ArrowDtype``)."""
+    arrow_dtype = getattr(pandas, 'ArrowDtype', None)
+    return arrow_dtype is not None and isinstance(col.dtype, arrow_dtype)
+
+
+def numpy_column(col, numeric_bools=False):
+    """A series with a NumPy dtype for one with Arrow-backed, nullable or string extension values,
+    or the series itself. Missing integers become NaN and other missing values None, as in pandas.
+    With numeric_bools, booleans with missing values become 1.0, 0.0 and NaN, like integers."""
+    if isinstance(col.dtype, numpy.dtype):
+        return col
+    if isinstance(col.dtype, getattr(pandas, 'StringDtype', ())):
+        dtype = numpy.dtype(object)
+    else:
+        dtype = getattr(col.dtype, 'numpy_dtype', None)
+        if dtype is None:
+            return col
+    if (dtype.kind in 'iu' or (numeric_bools and dtype.kind == 'b')) and col.hasnans:
+        values = col.to_numpy(dtype=numpy.float64, na_value=numpy.nan)
+    elif dtype.kind in 'OSUb':
+        values = col.to_numpy(dtype=object, na_value=None) if col.hasnans else col.to_numpy(dtype=dtype)
+        if dtype.kind in 'SU':
+            values = values.astype(object)
+    else:
+        values = col.to_numpy(dtype=dtype)
+    return pandas.Series(values, index=col.index, name=col.name)
@@ -44,12 +44,15 @@ setup(
     author='The Graphistry Team',
     author_email='pygraphistry@graphistry.com',
     setup_requires=['numpy'],
-    install_requires=['numpy', 'pandas', 'requests', 'future >= 0.15.0'],
+    install_requires=['numpy', 'pandas', 'requests', 'future >= 0.15.0',
+                      'futures; python_version < "3.2"'],
     extras_require={
         'igraph': ['python-igraph'],
         'networkx': ['networkx'],
+        'arrow': ['pyarrow'],
+        'scipy': ['scipy'],
         'pandas-extra': ['numexpr', 'Bottleneck'],
-        'all': ['python-igraph', 'networkx', 'numexpr', 'Bottleneck']
+        'all': ['python-igraph', 'networkx', 'pyarrow', 'scipy', 'numexpr', 'Bottleneck']
     },
     license='BSD',
     classifiers=[
@@ -0,0 +1,164 @@
+"""Local stand-in for the Graphistry ETL server, for tests of the upload protocols."""
+from __future__ import absolute_import
+from future import standard_library
+standard_library.install_aliases()
+import base64
+import gzip
+import hashlib
+import io
+import json
+import re
+import threading
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from socketserver import ThreadingMixIn
+from urllib.parse import urlparse
+
+
+class EtlServer(ThreadingMixIn, HTTPServer):
+    """Accepts datasets on /etl and chunked uploads on /etl/uploads, and records every request.
+
+    Datasets are named dataset0, dataset1, ... and keep their metadata and data parts. API 1 JSON
+    datasets, posted directly or committed from chunks, have no metadata and are their data0 part. Setting
+    failing_parts[part] = n rejects the next n uploads of that part of a chunked upload.
+    """
+
+    daemon_threads = True
+
+    def __init__(self):
+        HTTPServer.__init__(self, ('127.0.0.1', 0), _Handler)
+        self.check = {'success': True, 'vgraphversion': 3, 'jsonlayouts': ['records', 'columns']}
+        self.requests = []
+        self.datasets = {}
+        self.uploads = {}
+        self.failing_parts = {}
+        self.lock = threading.Lock()
+
+    @property
+    def host(self):
+        return '127.0.0.1:%d' % self.server_port
+
+    def start(self):
+        thread = threading.Thread(target=self.serve_forever)
+        thread.daemon = True
+        thread.start()
+
+    def stop(self):
+        self.shutdown()
+        self.server_close()
+
+    def etl_posts(self):
+        """Datasets posted to /etl, as dicts of their metadata and parts, in order."""
+        return [r for r in self.requests if r['method'] == 'POST' and r['path'] == '/etl']
+
+    def puts(self):
+        return [r for r in self.requests if r['method'] == 'PUT']
+
+    def create_dataset(self, metadata, parts):
+        sources = metadata.get('datasources', []) if metadata else []
+        if any(s['type'] == 'dataset' and s['name'] not in self.datasets for s in sources):
+            return {'success': False, 'msg': 'Unknown dataset'}
+        with self.lock:
+            name = 'dataset%d' % len(self.datasets)
+            self.datasets[name] = {'metadata': metadata, 'parts': parts}
+        return {'success': True, 'dataset': name, 'viztoken': 'token-' + name}
+
+
+def _multipart(body, content_type):
+    boundary = re.search('boundary=([^;]+)', content_type).group(1).strip('"').encode('ascii')
+    parts = {}
+    for segment in body.split(b'--' + boundary)[1:-1]:
+        (head, data) = segment.split(b'\r\n\r\n', 1)
+        name = re.search(b'name="([^"]+)"', head).group(1).decode('utf8')
+        parts[name] = data[:-2]
+    return parts
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+
+    def log_message(self, *args):
+        pass
+
+    def body(self):
+        if self.headers.get('Transfer-Encoding') == 'chunked':
+            out = io.BytesIO()
+            while True:
+                size = int(self.rfile.readline().strip(), 16)
+                if size == 0:
+                    self.rfile.readline()
+                    return out.getvalue()
+                out.write(self.rfile.read(size))
+                self.rfile.readline()
+        return self.rfile.read(int(self.headers.get('Content-Length', 0)))
+
+    def reply(self, obj, status=200):
+        data = json.dumps(obj).encode('utf8')
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def record(self, **fields):
+        url = urlparse(self.path)
+        fields.update(method=self.command, path=url.path, query=url.query)
+        self.server.requests.append(fields)
+        return url.path.strip('/').split('/')
+
+    def do_GET(self):
+        path = self.record()
+        if path == ['api', 'check']:
+            self.reply(self.server.check)
+        elif path[:2] == ['etl', 'uploads'] and len(path) == 3:
+            upload = self.server.uploads.get(path[2])
+            if upload is None:
+                self.reply({'success': False, 'msg': 'Unknown upload'})
+            else:
+                self.reply({'success': True, 'received': sorted(upload['parts'])})
+        else:
+            self.reply({'success': False, 'msg': 'Not found'}, 404)
+
+    def do_PUT(self):
+        data = self.body()
+        path = self.record(size=len(data))
+        (upload, part) = (self.server.uploads.get(path[2]), int(path[3]))
+        if self.server.failing_parts.get(part, 0) > 0:
+            self.server.failing_parts[part] -= 1
+            self.reply({'success': False, 'msg': 'Unavailable'}, 503)
+            return
+        checksum = base64.b64encode(hashlib.md5(data).digest()).decode('ascii')
+        if upload is None or checksum != self.headers.get('Content-MD5'):
+            self.reply({'success': False, 'msg': 'Bad part'}, 400)
+            return
+        upload['parts'][part] = data
+        self.reply({'success': True})
+
+    def do_POST(self):
+        data = self.body()
+        content_type = self.headers.get('Content-Type', '')
+        if self.headers.get('Content-Encoding') == 'gzip':
+            data = gzip.GzipFile(fileobj=io.BytesIO(data)).read()
+        if content_type.startswith('multipart/form-data'):
+            parts = _multipart(data, content_type)
+            metadata = json.loads(parts['metadata'].decode('utf8'))
+        else:
+            parts = {}
+            metadata = json.loads(data.decode('utf8')) if data else None
+        path = self.record(metadata=metadata, parts=parts)
+
+        if path == ['etl'] and not parts:
+            # API 1: the body is the JSON dataset itself, kept as data0 like committed chunked uploads
+            self.reply(self.server.create_dataset(None, {'data0': data}))
+        elif path == ['etl']:
+            self.reply(self.server.create_dataset(metadata, parts))
+        elif path == ['etl', 'uploads']:
+            name = 'upload%d' % len(self.server.uploads)
+            self.server.uploads[name] = {'parts': {}, 'count': metadata['parts']}
+            self.reply({'success': True, 'upload': name})
+        elif path[:2] == ['etl', 'uploads'] and path[3:] == ['commit']:
+            upload = self.server.uploads.pop(path[2])
+            payload = b''.join(upload['parts'][i] for i in range(upload['count']))
+            self.reply(self.server.create_dataset(metadata.get('metadata'),
+                                                  {'data0': gzip.GzipFile(fileobj=io.BytesIO(payload)).read()}))
+        else:
+            self.reply({'success': False, 'msg': 'Not found'}, 404)
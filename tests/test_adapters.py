@@ -0,0 +1,87 @@
+import threading
+import time
+import unittest
+import networkx
+import pandas
+
+import graphistry
+from graphistry.plotter import Plotter
+
+
+class SlowGraph(object):
+    """Graph type of a package whose adapters take a while to load."""
+    __module__ = 'slowgraphs.core'
+
+
+class EdgeList(object):
+    """Graph type of a user's own library, as a list of (src, dst) pairs."""
+
+    def __init__(self, pairs):
+        self.pairs = pairs
+
+
+class LabeledDiGraph(networkx.DiGraph):
+    pass
+
+
+class TestAdapters(unittest.TestCase):
+    """Graph types are dispatched to the adapter of their nearest registered class."""
+
+    def setUp(self):
+        self.adapters = dict(Plotter._adapters)
+        self.loaders = dict(Plotter._adapterLoaders)
+        Plotter._adapterCache.clear()
+
+    def tearDown(self):
+        (Plotter._adapters, Plotter._adapterLoaders) = (self.adapters, self.loaders)
+        Plotter._adapterCache.clear()
+
+    def test_concurrent_lookups_wait_for_a_loading_package(self):
+        def load():
+            time.sleep(0.2)
+            return {SlowGraph: lambda plotter, graph, nodes: (None, None)}
+        Plotter._adapterLoaders['slowgraphs'] = load
+
+        found = []
+        threads = [threading.Thread(target=lambda: found.append(Plotter._adapter(SlowGraph)))
+                   for _ in range(2)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(len(found), 2)
+        self.assertTrue(all(adapter is not None for adapter in found))
+        self.assertNotIn('slowgraphs', Plotter._adapterLoaders)
+
+    def test_registered_type(self):
+        def edgelist2pandas(plotter, graph, nodes):
+            return (pandas.DataFrame(graph.pairs, columns=[plotter._source, plotter._destination]), nodes)
+        graphistry.register_adapter(EdgeList, edgelist2pandas)
+        g = graphistry.bind(source='src', destination='dst', node='id')
+
+        (edges, nodes) = g._graph_frames(EdgeList([(1, 2), (2, 3)]), None)
+
+        self.assertEqual(edges.values.tolist(), [[1, 2], [2, 3]])
+        self.assertIsNone(nodes)
+
+    def test_subclass_uses_the_adapter_of_its_base(self):
+        nx = LabeledDiGraph()
+        nx.add_edge('a', 'b', weight=2.0)
+        g = graphistry.bind(source='src', destination='dst', node='id')
+
+        (edges, nodes) = g._graph_frames(nx, None)
+
+        self.assertEqual(edges.values.tolist(), [['a', 'b', 2.0]])
+        self.assertEqual(nodes['id'].tolist(), ['a', 'b'])
+
+    def test_registered_adapter_overrides_a_built_in_one(self):
+        graphistry.register_adapter(LabeledDiGraph, lambda plotter, graph, nodes: ('custom', 'nodes'))
+        g = graphistry.bind(source='src', destination='dst', node='id')
+
+        self.assertEqual(g._graph_frames(LabeledDiGraph(), None), ('custom', 'nodes'))
+        self.assertEqual(len(g._graph_frames(networkx.DiGraph(), None)[0]), 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,63 @@
+import shutil
+import tempfile
+import unittest
+import pandas
+
+import graphistry
+from graphistry.pygraphistry import PyGraphistry
+from etl_server import EtlServer
+
+
+class TestBatch(unittest.TestCase):
+    """plot_batch uploads go through the upload cache, re-binding and chunked uploads."""
+
+    def setUp(self):
+        self.server = EtlServer()
+        self.server.start()
+        self.tmp = tempfile.mkdtemp()
+        PyGraphistry._uploaded_datasets.clear()
+        self.edges = pandas.DataFrame({'src': [1, 2, 3], 'dst': [2, 3, 1], 'weight': [0.5, 1.0, 2.0]})
+        self.g = graphistry.bind(source='src', destination='dst', node='id')
+
+    def tearDown(self):
+        self.server.stop()
+        shutil.rmtree(self.tmp)
+
+    def register(self, **settings):
+        graphistry.register('key', server=self.server.host, protocol='http', api=2, **settings)
+
+    def batch(self, plotters):
+        results = graphistry.plot_batch(plotters, encode_workers=2)
+        for result in results:
+            if isinstance(result, Exception):
+                raise result
+        return results
+
+    def test_cached_datasets_are_not_uploaded_again(self):
+        self.register(cache=self.tmp)
+        first = self.batch([(self.g, self.edges)])
+        second = self.batch([(self.g, self.edges)])
+
+        self.assertEqual(first, second)
+        self.assertEqual(len(self.server.etl_posts()), 1)
+
+    def test_new_encodings_reuse_the_uploaded_dataset(self):
+        self.register()
+        self.batch([(self.g, self.edges)])
+        self.batch([(self.g.bind(edge_weight='weight'), self.edges)])
+
+        (upload, rebind) = self.server.etl_posts()
+        self.assertEqual(sorted(rebind['parts']), ['metadata'])
+        self.assertEqual(rebind['metadata']['view']['encodings']['edgeWeight'], 'weight')
+
+    def test_chunked_uploads(self):
+        self.register(chunk_size=64, checkpoint_dir=self.tmp)
+        self.batch([(self.g, self.edges)])
+
+        self.assertEqual(self.server.etl_posts(), [])
+        self.assertGreater(len(self.server.puts()), 1)
+        self.assertEqual(len(self.server.datasets), 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,88 @@
+import os
+import shutil
+import tempfile
+import unittest
+import numpy
+import pandas
+import requests
+
+import graphistry
+from graphistry.pygraphistry import PyGraphistry
+from graphistry.graph_vector_pb2 import VectorGraph
+from etl_server import EtlServer
+
+
+class TestChunkedUpload(unittest.TestCase):
+    """Chunked uploads survive interruptions, and resume from their checkpoints."""
+
+    def setUp(self):
+        self.server = EtlServer()
+        self.server.start()
+        self.checkpoints = tempfile.mkdtemp()
+        graphistry.register('key', server=self.server.host, protocol='http', api=2,
+                            chunk_size=4096, checkpoint_dir=self.checkpoints)
+        PyGraphistry._uploaded_datasets.clear()
+        rng = numpy.random.RandomState(0)
+        self.edges = pandas.DataFrame({'src': rng.randint(0, 1000, 5000), 'dst': rng.randint(0, 1000, 5000),
+                                       'weight': rng.rand(5000)})
+        self.g = graphistry.bind(source='src', destination='dst', node='id', edge_weight='weight')
+
+    def tearDown(self):
+        self.server.stop()
+        shutil.rmtree(self.checkpoints)
+
+    def part_numbers(self, puts):
+        return [int(put['path'].split('/')[-1]) for put in puts]
+
+    def committed_vgraph(self, url):
+        name = url.split('dataset=')[1].split('&')[0]
+        dataset = self.server.datasets[name]
+        self.assertEqual(dataset['metadata']['datasources'], [{'type': 'vgraph', 'url': 'data0'}])
+        self.assertEqual(dataset['metadata']['view']['encodings']['edgeWeight'], 'weight')
+        return VectorGraph.FromString(dataset['parts']['data0'])
+
+    def test_upload_in_parts(self):
+        url = self.g._upload(self.edges, None)
+
+        parts = self.part_numbers(self.server.puts())
+        self.assertGreater(len(parts), 2)
+        self.assertEqual(parts, list(range(len(parts))))
+        self.assertEqual(self.committed_vgraph(url).nedges, len(self.edges))
+        self.assertEqual(os.listdir(self.checkpoints), [])
+
+    def test_interrupted_upload_resumes_with_missing_parts(self):
+        self.server.failing_parts[2] = PyGraphistry._chunk_retries
+        with self.assertRaises(requests.exceptions.HTTPError):
+            self.g._upload(self.edges, None)
+        sent = len(self.server.puts())
+        self.assertEqual(len(os.listdir(self.checkpoints)), 2)
+
+        url = self.g._upload(self.edges, None)
+
+        resumed = self.part_numbers(self.server.puts()[sent:])
+        self.assertEqual(resumed[0], 2)
+        self.assertEqual(resumed, list(range(2, 2 + len(resumed))))
+        self.assertEqual(len([r for r in self.server.requests if r['path'] == '/etl/uploads']), 1)
+        self.assertEqual(self.committed_vgraph(url).nedges, len(self.edges))
+        self.assertEqual(os.listdir(self.checkpoints), [])
+
+    def test_upload_unknown_to_the_server_starts_over(self):
+        self.server.failing_parts[2] = PyGraphistry._chunk_retries
+        with self.assertRaises(requests.exceptions.HTTPError):
+            self.g._upload(self.edges, None)
+        self.server.uploads.clear()
+        sent = len(self.server.puts())
+
+        url = self.g._upload(self.edges, None)
+
+        self.assertEqual(self.part_numbers(self.server.puts()[sent:])[0], 0)
+        self.assertEqual(len([r for r in self.server.requests if r['path'] == '/etl/uploads']), 2)
+        self.assertEqual(self.committed_vgraph(url).nedges, len(self.edges))
+
+    def test_arrow_uploads_cannot_be_chunked(self):
+        with self.assertRaises(ValueError):
+            graphistry.register('key', server=self.server.host, protocol='http', api=3, chunk_size=4096)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,38 @@
+import unittest
+
+from graphistry.pygraphistry import PyGraphistry
+
+
+class TestCompressionReport(unittest.TestCase):
+    """compression_report describes the last gzipped payload."""
+
+    def setUp(self):
+        self.level = PyGraphistry.compression_level
+        self.payload = b'graphistry ' * 10000
+
+    def tearDown(self):
+        PyGraphistry.compression_level = self.level
+
+    def compress(self, level, chunks, total_size=None):
+        PyGraphistry.compression_level = level
+        return b''.join(PyGraphistry._gzip_chunks(chunks, total_size=total_size))
+
+    def test_fixed_level_replaces_auto_report(self):
+        self.compress('auto', [self.payload], len(self.payload))
+        self.assertIsNotNone(PyGraphistry.compression_report['estimates'])
+
+        self.compress(9, [self.payload], len(self.payload))
+
+        self.assertEqual(PyGraphistry.compression_report['level'], 9)
+        self.assertEqual(PyGraphistry.compression_report['scope'], 'payload')
+        self.assertIsNone(PyGraphistry.compression_report['estimates'])
+
+    def test_unknown_total_size_reports_the_first_chunk(self):
+        self.compress('auto', [self.payload, self.payload])
+
+        self.assertEqual(PyGraphistry.compression_report['scope'], 'first chunk')
+        self.assertEqual(PyGraphistry.compression_report['size'], len(self.payload))
+
+
+if __name__ == '__main__':
+    unittest.main()
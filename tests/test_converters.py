@@ -0,0 +1,63 @@
+import unittest
+import igraph
+import networkx
+import pandas
+
+import graphistry
+
+
+class TestConverters(unittest.TestCase):
+    """IGraph and NetworkX graphs convert to and from the edge and node frames they came from."""
+
+    def setUp(self):
+        self.g = graphistry.bind(source='src', destination='dst', node='id')
+        self.edges = pandas.DataFrame({'src': ['a', 'b', 'c', 'a'], 'dst': ['b', 'c', 'a', 'd'],
+                                       'weight': [0.5, 1.0, 2.0, 4.0]})
+
+    def test_pandas_igraph_round_trip(self):
+        ig = self.g.pandas2igraph(self.edges)
+        self.assertEqual(ig.vs['id'], ['a', 'b', 'c', 'd'])
+        self.assertEqual(ig.get_edgelist(), [(0, 1), (1, 2), (2, 0), (0, 3)])
+
+        (edges, nodes) = self.g.igraph2pandas(ig)
+
+        pandas.testing.assert_frame_equal(edges, self.edges)
+        self.assertEqual(nodes['id'].tolist(), ['a', 'b', 'c', 'd'])
+
+    def test_igraph2pandas_leaves_the_graph_unchanged(self):
+        ig = igraph.Graph(edges=[(0, 1), (1, 2)], directed=True)
+        ig.vs['id'] = ['x', 'y', 'z']
+        ig.es['weight'] = [1.0, 2.0]
+
+        (edges, nodes) = self.g.igraph2pandas(ig)
+
+        self.assertEqual(edges[['src', 'dst']].values.tolist(), [['x', 'y'], ['y', 'z']])
+        self.assertEqual((ig.vs.attributes(), ig.es.attributes()), (['id'], ['weight']))
+
+    def test_networkx_multigraph_keeps_parallel_edges(self):
+        nx = networkx.MultiDiGraph()
+        nx.add_node('a', size=1)
+        nx.add_node('b', size=2)
+        nx.add_edge('a', 'b', weight=1.0)
+        nx.add_edge('a', 'b', weight=2.0)
+        nx.add_edge('b', 'a', weight=3.0, kind='back')
+
+        (edges, nodes) = self.g.networkx2pandas(nx)
+
+        self.assertEqual(edges.columns.tolist(), ['src', 'dst', '__edgekey__', 'weight', 'kind'])
+        self.assertEqual(edges[['src', 'dst', '__edgekey__', 'weight']].values.tolist(),
+                         [['a', 'b', 0, 1.0], ['a', 'b', 1, 2.0], ['b', 'a', 0, 3.0]])
+        self.assertEqual(edges['kind'].isnull().tolist(), [True, True, False])
+        self.assertEqual(nodes.values.tolist(), [['a', 1], ['b', 2]])
+
+    def test_networkx_graph_without_attributes(self):
+        nx = networkx.Graph([(1, 2), (2, 3)])
+
+        (edges, nodes) = self.g.networkx2pandas(nx)
+
+        self.assertEqual(edges.values.tolist(), [[1, 2], [2, 3]])
+        self.assertEqual(nodes['id'].tolist(), [1, 2, 3])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,66 @@
+import gzip
+import io
+import unittest
+import pandas
+
+import graphistry
+from graphistry import util
+from graphistry.pygraphistry import PyGraphistry
+from graphistry.graph_vector_pb2 import VectorGraph
+from etl_server import EtlServer
+
+
+class TestDowncast(unittest.TestCase):
+    """Downcasting reports each dataset it narrows, and warns when the schema cannot carry it."""
+
+    def setUp(self):
+        self.server = EtlServer()
+        self.server.start()
+        PyGraphistry._uploaded_datasets.clear()
+        self.edges = pandas.DataFrame({'src': [1, 2, 3], 'dst': [2, 3, 1], 'weight': [0.5, 1.0, 2.0],
+                                       'delta': [-1, -70000, 5]})
+        self.g = graphistry.bind(source='src', destination='dst', node='id')
+        (self.warn, self.warnings) = (util.warn, [])
+        util.warn = self.warnings.append
+
+    def tearDown(self):
+        util.warn = self.warn
+        self.server.stop()
+
+    def upload(self, vgraph_version, downcast=True):
+        graphistry.register('key', server=self.server.host, protocol='http', api=2,
+                            vgraph_version=vgraph_version, downcast=downcast)
+        self.g._upload(self.edges, None)
+        data = self.server.etl_posts()[-1]['parts']['data0']
+        return VectorGraph.FromString(gzip.GzipFile(fileobj=io.BytesIO(data)).read())
+
+    def test_report_of_downcast_dataset(self):
+        vg = self.upload(3)
+
+        self.assertEqual([c['column'] for c in PyGraphistry.downcast_report['columns']], ['weight'])
+        self.assertEqual(PyGraphistry.downcast_report['bytes_saved'], 12)
+        self.assertEqual(list(vg.float_vectors[0].values), [0.5, 1.0, 2.0])
+        self.assertEqual(list(vg.int64_vectors[0].values), [-1, -70000, 5])
+        self.assertEqual(self.warnings, [])
+
+    def test_zero_tolerance_is_lossless_downcasting(self):
+        self.upload(3, downcast=0.0)
+
+        self.assertEqual(PyGraphistry.downcast_report['bytes_saved'], 12)
+
+    def test_invalid_settings_are_rejected(self):
+        for downcast in [1, -0.1, 'yes']:
+            with self.assertRaises(ValueError):
+                graphistry.register('key', server=self.server.host, protocol='http', api=2, downcast=downcast)
+
+    def test_old_schema_resets_report_and_warns(self):
+        self.upload(3)
+        self.edges = self.edges.drop(columns=['delta'])
+        self.upload(2)
+
+        self.assertIsNone(PyGraphistry.downcast_report)
+        self.assertEqual(len(self.warnings), 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,79 @@
+# -*- coding: utf-8 -*-
+import json
+import math
+import shutil
+import tempfile
+import unittest
+import numpy
+import pandas
+
+import graphistry
+from graphistry.pygraphistry import PyGraphistry
+from etl_server import EtlServer
+
+
+class TestJsonDatasets(unittest.TestCase):
+    """API 1 datasets parse to the records of their edge and node frames, in every layout."""
+
+    def setUp(self):
+        self.server = EtlServer()
+        self.server.start()
+        self.checkpoints = tempfile.mkdtemp()
+        self.edges = pandas.DataFrame({'src': [1, 2, 3], 'dst': [2, 3, 1],
+                                       'weight': [0.5, numpy.nan, 2.0],
+                                       'label': [u'café', None, u'图'],
+                                       'flag': [True, False, True],
+                                       'count': [1, 2, 3]})
+        self.nodes = pandas.DataFrame({'id': [1, 2, 3], 'size': [1.0, numpy.nan, 3.0],
+                                       'name': [u'à', u'b', None]})
+        self.g = graphistry.bind(source='src', destination='dst', node='id')
+        # Rows are written a few at a time, so chunks split the frames
+        (self.chunk_rows, PyGraphistry._json_chunk_rows) = (PyGraphistry._json_chunk_rows, 2)
+
+    def tearDown(self):
+        PyGraphistry._json_chunk_rows = self.chunk_rows
+        self.server.stop()
+        shutil.rmtree(self.checkpoints)
+
+    def records(self, df):
+        """Rows as to_dict(orient='records') gives them, with NaN as None."""
+        return [dict((k, None if isinstance(v, float) and math.isnan(v) else v) for (k, v) in row.items())
+                for row in df.to_dict(orient='records')]
+
+    def upload(self, **settings):
+        graphistry.register('key', server=self.server.host, protocol='http', api=1, **settings)
+        self.g._upload(self.edges, self.nodes)
+        (dataset,) = self.server.datasets.values()
+        return json.loads(dataset['parts']['data0'].decode('utf8'))
+
+    def check(self, dataset):
+        (elist, nlist) = self.g._bind_attributes_v1(self.edges, self.nodes)
+        (graph, labels) = (dataset['graph'], dataset['labels'])
+        if dataset['type'] == 'edgelist_columns':
+            graph = [dict(zip(graph, row)) for row in zip(*graph.values())]
+            labels = [dict(zip(labels, row)) for row in zip(*labels.values())]
+        self.assertEqual(graph, self.records(elist))
+        self.assertEqual(labels, self.records(nlist))
+
+    def test_records(self):
+        dataset = self.upload()
+        self.assertEqual(dataset['type'], 'edgelist')
+        self.check(dataset)
+
+    def test_columns(self):
+        dataset = self.upload(json_layout='columns')
+        self.assertEqual(dataset['type'], 'edgelist_columns')
+        self.check(dataset)
+
+    def test_streamed_records_and_columns(self):
+        for layout in ['records', 'columns']:
+            self.server.datasets.clear()
+            self.check(self.upload(json_layout=layout, stream_upload=True))
+
+    def test_chunked_upload(self):
+        self.check(self.upload(chunk_size=64, checkpoint_dir=self.checkpoints))
+        self.assertGreater(len(self.server.puts()), 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
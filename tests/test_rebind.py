@@ -0,0 +1,77 @@
+import shutil
+import tempfile
+import unittest
+import pandas
+
+import graphistry
+from graphistry.pygraphistry import PyGraphistry
+from graphistry.plotter import Plotter
+from etl_server import EtlServer
+
+
+class TestRebind(unittest.TestCase):
+    """API 2 plots of already uploaded data send only their view encodings."""
+
+    def setUp(self):
+        self.server = EtlServer()
+        self.server.start()
+        graphistry.register('key', server=self.server.host, protocol='http', api=2)
+        PyGraphistry._uploaded_datasets.clear()
+        self.edges = pandas.DataFrame({'src': [1, 2, 3], 'dst': [2, 3, 1],
+                                       'kind': ['a', 'b', 'a'], 'weight': [0.5, 1.0, 2.0]})
+        self.g = graphistry.bind(source='src', destination='dst', node='id')
+
+    def tearDown(self):
+        self.server.stop()
+
+    def test_new_encodings_reuse_the_uploaded_dataset(self):
+        self.g.bind(edge_color='kind')._upload(self.edges, None)
+        url = self.g.bind(edge_color='weight')._upload(self.edges, None)
+
+        (upload, rebind) = self.server.etl_posts()
+        self.assertEqual(sorted(upload['parts']), ['data0', 'metadata'])
+        self.assertEqual(sorted(rebind['parts']), ['metadata'])
+        self.assertEqual(rebind['metadata']['datasources'], [{'type': 'dataset', 'name': 'dataset0'}])
+        self.assertEqual(rebind['metadata']['view']['encodings']['edgeColor'], 'weight')
+        self.assertIn('dataset=dataset1', url)
+
+    def test_changed_data_is_uploaded(self):
+        self.g._upload(self.edges, None)
+        self.g._upload(self.edges.assign(weight=[0.5, 1.0, 3.0]), None)
+
+        self.assertEqual([sorted(p['parts']) for p in self.server.etl_posts()],
+                         [['data0', 'metadata'], ['data0', 'metadata']])
+
+    def test_changed_structural_bindings_are_uploaded(self):
+        self.g._upload(self.edges, None)
+        self.g.bind(source='dst', destination='src')._upload(self.edges, None)
+
+        self.assertEqual(len([p for p in self.server.etl_posts() if 'data0' in p['parts']]), 2)
+
+    def test_unknown_dataset_falls_back_to_an_upload(self):
+        self.g._upload(self.edges, None)
+        self.server.datasets.clear()
+        url = self.g.bind(edge_color='weight')._upload(self.edges, None)
+
+        (upload, rebind, reupload) = self.server.etl_posts()
+        self.assertEqual(rebind['metadata']['datasources'][0]['type'], 'dataset')
+        self.assertEqual(sorted(reupload['parts']), ['data0', 'metadata'])
+        self.assertIn('dataset=dataset0', url)
+
+    def test_frames_are_hashed_once_per_upload(self):
+        cache = tempfile.mkdtemp()
+        digest = Plotter._frames_digest
+        calls = []
+        Plotter._frames_digest = lambda plotter, edges, nodes: calls.append(1) or digest(plotter, edges, nodes)
+        try:
+            graphistry.register('key', server=self.server.host, protocol='http', api=2, cache=cache)
+            self.g._upload(self.edges, None)
+        finally:
+            Plotter._frames_digest = digest
+            shutil.rmtree(cache)
+
+        self.assertEqual(len(calls), 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
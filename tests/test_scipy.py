@@ -0,0 +1,55 @@
+import gzip
+import io
+import unittest
+import pandas
+import scipy.sparse
+
+import graphistry
+from graphistry import util
+from graphistry.pygraphistry import PyGraphistry
+from graphistry.graph_vector_pb2 import VectorGraph
+from etl_server import EtlServer
+
+
+class TestScipy(unittest.TestCase):
+    """Sparse adjacency matrices upload as graphs, and categorical frames keep their vertex counts."""
+
+    def setUp(self):
+        self.server = EtlServer()
+        self.server.start()
+        graphistry.register('key', server=self.server.host, protocol='http', api=2)
+        PyGraphistry._uploaded_datasets.clear()
+        self.g = graphistry.bind(source='src', destination='dst', node='id', edge_weight='weight')
+        (self.warn, self.warnings) = (util.warn, [])
+        util.warn = self.warnings.append
+
+    def tearDown(self):
+        util.warn = self.warn
+        self.server.stop()
+
+    def uploaded_vgraph(self):
+        data = self.server.etl_posts()[-1]['parts']['data0']
+        return VectorGraph.FromString(gzip.GzipFile(fileobj=io.BytesIO(data)).read())
+
+    def test_matrix_with_node_labels(self):
+        matrix = scipy.sparse.csr_matrix(([1.0, 2.0], ([0, 1], [1, 2])), shape=(4, 4))
+        g = graphistry.bind(source='src', destination='dst')
+        g._upload(matrix, ['a', 'b', 'c', 'd'])
+
+        vg = self.uploaded_vgraph()
+        self.assertEqual((vg.nvertices, vg.nedges), (4, 2))
+        self.assertEqual(len(self.warnings), 2)
+        self.assertEqual((g._node, g._edge_weight), (None, None))
+
+    def test_unused_categories_are_not_vertices(self):
+        kinds = pandas.CategoricalDtype(['a', 'b', 'c', 'd'])
+        edges = pandas.DataFrame({'src': pandas.Series(['a'], dtype=kinds), 'dst': pandas.Series(['b'], dtype=kinds),
+                                  'weight': [1.0]})
+        self.g._upload(edges, None)
+
+        vg = self.uploaded_vgraph()
+        self.assertEqual((vg.nvertices, vg.nedges), (2, 1))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,114 @@
+import unittest
+import numpy
+import pandas
+
+import graphistry
+from graphistry.pygraphistry import PyGraphistry
+from graphistry.graph_vector_pb2 import VectorGraph
+
+
+class TestVectorGraph(unittest.TestCase):
+    """VectorGraph datasets parse back to the values of their edge and node frames."""
+
+    def setUp(self):
+        self.version = PyGraphistry.vgraph_version
+        self.g = graphistry.bind(source='src', destination='dst', node='id')
+        self.edges = pandas.DataFrame({'src': [1, 2, 3], 'dst': [2, 3, 1]})
+
+    def tearDown(self):
+        PyGraphistry.vgraph_version = self.version
+
+    def encode(self, version, edges, nodes=None):
+        PyGraphistry.vgraph_version = version
+        vg = self.g._make_vgraph_dataset(edges, nodes)['vgraph']
+        return VectorGraph.FromString(vg.SerializeToString())
+
+    def reference(self, name, edges, nodes):
+        """Version 0 vgraph built value by value, with one Edge message per edge."""
+        labels = pandas.concat([edges['src'], edges['dst']], ignore_index=True).unique().tolist()
+        index = dict((label, i) for (i, label) in enumerate(labels))
+        vg = VectorGraph()
+        (vg.version, vg.name, vg.type) = (0, name, VectorGraph.DIRECTED)
+        (vg.nvertices, vg.nedges) = (len(labels), len(edges))
+        for (src, dst) in zip(edges['src'].tolist(), edges['dst'].tolist()):
+            edge = vg.edges.add()
+            (edge.src, edge.dst) = (index[src], index[dst])
+        vertices = nodes.set_index('id').loc[labels].reset_index()
+        for (df, target, skip) in [(edges, VectorGraph.EDGE, ['src', 'dst']), (vertices, VectorGraph.VERTEX, ['id'])]:
+            for col in df.columns:
+                if col in skip:
+                    continue
+                fields = {'f': vg.double_vectors, 'i': vg.int32_vectors, 'O': vg.string_vectors}
+                vec = fields[df[col].dtype.kind].add()
+                (vec.name, vec.target) = (col, target)
+                for value in df[col].tolist():
+                    vec.values.append(value)
+        return vg
+
+    def test_version_0_matches_edge_by_edge_encoding(self):
+        edges = pandas.DataFrame({'src': ['b', 'a', 'c', 'a'], 'dst': ['a', 'c', 'b', 'd'],
+                                  'weight': [0.5, 1.0, 2.5, -3.0], 'count': [1, 2, 300, 4],
+                                  'label': [u'x', u'y', u'\u00e9', u'x']})
+        nodes = pandas.DataFrame({'id': ['d', 'c', 'b', 'a'], 'size': [1.0, 2.0, 3.0, 4.0]})
+        vg = self.encode(0, edges, nodes)
+
+        self.assertEqual(vg.SerializeToString(), self.reference(vg.name, edges, nodes).SerializeToString())
+
+    def test_versions_1_to_3_round_trip(self):
+        edges = pandas.DataFrame({'src': [10, 20, 30, 10, 40], 'dst': [20, 30, 10, 40, 10],
+                                  'count': numpy.array([1, 2, 3, 2 ** 31, 0], dtype=numpy.int64),
+                                  'score': numpy.array([0.5, 1.5, 2.5, 3.5, 0], dtype=numpy.float32),
+                                  'kind': ['a', 'b', 'a', 'a', 'a']})
+        for version in [1, 2, 3]:
+            vg = self.encode(version, edges)
+
+            labels = [10, 20, 30, 40]
+            self.assertEqual([labels[i] for i in vg.sources], [10, 20, 30, 10, 40])
+            self.assertEqual([labels[i] for i in vg.destinations], [20, 30, 10, 40, 10])
+            ints = self.vectors(vg, 'int64_vectors' if version >= 3 else 'int32_vectors')
+            self.assertEqual(ints['count'], [1, 2, 3, 2 ** 31, 0])
+            floats = self.vectors(vg, 'float_vectors' if version >= 3 else 'double_vectors')
+            self.assertEqual(floats['score'], [0.5, 1.5, 2.5, 3.5, 0])
+            if version >= 2:
+                (kinds,) = [v for v in vg.dictionary_vectors if v.name == 'kind']
+                self.assertEqual([kinds.dictionary[c] for c in kinds.codes], ['a', 'b', 'a', 'a', 'a'])
+            else:
+                self.assertEqual(self.vectors(vg, 'string_vectors')['kind'], ['a', 'b', 'a', 'a', 'a'])
+
+    def vectors(self, vg, field):
+        return dict((v.name, list(v.values)) for v in getattr(vg, field))
+
+    def test_signed_integers_keep_their_sign(self):
+        edges = self.edges.assign(i8=numpy.array([-1, 0, 5], dtype=numpy.int8),
+                                  i32=numpy.array([-70000, 1, 2], dtype=numpy.int32),
+                                  u32=numpy.array([0, 1, 2 ** 32 - 1], dtype=numpy.uint32))
+        vg = self.encode(3, edges)
+
+        self.assertEqual(self.vectors(vg, 'int64_vectors'),
+                         {'i8': [-1, 0, 5], 'i32': [-70000, 1, 2], 'u32': [0, 1, 2 ** 32 - 1]})
+
+    def test_uint64_beyond_int64_is_sent_as_strings(self):
+        edges = self.edges.assign(big=numpy.array([2 ** 63 + 5, 1, 2], dtype=numpy.uint64))
+        vg = self.encode(3, edges)
+
+        self.assertEqual(self.vectors(vg, 'string_vectors'), {'big': [str(2 ** 63 + 5), '1', '2']})
+
+    def test_nullable_booleans_are_numbers(self):
+        edges = self.edges.assign(flag=pandas.array([True, None, False], dtype='boolean'),
+                                  full=pandas.array([True, False, True], dtype='boolean'))
+        vg = self.encode(3, edges)
+
+        flags = self.vectors(vg, 'double_vectors')['flag']
+        self.assertEqual(flags[0::2], [1.0, 0.0])
+        self.assertTrue(numpy.isnan(flags[1]))
+        self.assertEqual(self.vectors(vg, 'int32_vectors'), {'full': [1, 0, 1]})
+        self.assertEqual(len(vg.string_vectors), 0)
+
+    def test_integers_without_an_exact_vector_are_rejected(self):
+        for values in [[-1, 0, 5], [2 ** 40, 0, 1]]:
+            with self.assertRaises(ValueError):
+                self.encode(2, self.edges.assign(x=values))
+
+
+if __name__ == '__main__':
+    unittest.main()